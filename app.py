@@ -1,27 +1,33 @@
+import functools
 import os
-import shutil
 import tempfile
+from contextlib import asynccontextmanager
 from typing import Optional
 
+import anyio
+import numpy as np
 from fastapi import FastAPI, File, Form, UploadFile, Request
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from config import Config
-from db import get_connection
+from db import close_pool, get_connection, open_pool
 from utils import extract_server_dirs
 
+from embedding.base import EmbeddingModel
+from embedding.batcher import EmbeddingBatcher
+from embedding.cache import DiskEmbeddingCache, embedding_key
 from embedding.minilm import MiniLMEmbedder
 
 from text_extraction.pdf_extraction import PDFTextExtractor
-from text_extraction.basic_extraction import TextFileTextExtractor, TikaTextExtractor, get_extractor_for_file
+from text_extraction.basic_extraction import TextFileTextExtractor, TikaTextExtractor, build_extractor_map, get_extractor_for_file
 from text_extraction.image_extraction import ImageTextExtractor
 from text_extraction.office_doc_extraction import PresentationTextExtractor, SpreadsheetTextExtractor, WordFileTextExtractor
 from text_extraction.web_extraction import HtmlTextExtractor, EmailTextExtractor
-from text_extraction.extraction_utils import common_char_replacements, strip_diacritics, normalize_unicode, normalize_whitespace
+from text_extraction.extraction_utils import normalize_text
 
-USER_SERVER_MOUNT_PATH = "N:\\PPDO\\Records"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
 
 # Initialize extractors and Tika fallback
 pdf_extractor = PDFTextExtractor()
@@ -43,6 +49,8 @@ extractors_list = [
     html_extractor,
     email_extractor,
 ]
+# extension -> extractor, built once so dispatch is a dict lookup
+extractors_by_ext = build_extractor_map(extractors_list)
 
 
 def extract_and_normalize_text(file_path: str) -> str:
@@ -59,29 +67,138 @@ def extract_and_normalize_text(file_path: str) -> str:
         Normalized text extracted from the file
     """
     # Select appropriate extractor or fallback to Tika
-    extractor = get_extractor_for_file(file_path, extractors_list)
+    extractor = get_extractor_for_file(file_path, extractors_by_ext)
     text = extractor(file_path) if extractor else tika_extractor(file_path)
     
     if text:
         # Apply normalization pipeline from add_files_pipeline
-        text = common_char_replacements(text)
-        text = strip_diacritics(text)
-        text = normalize_unicode(text)
-        text = normalize_whitespace(text)
+        text = normalize_text(text)
     
     return text or ""
 
 
-_embedder = MiniLMEmbedder()
+# Worker-thread budget for text extraction, which is mostly subprocess/C-library
+# work, so allow one per core. Embedding goes through _batcher, which runs one
+# encode at a time.
+_EXTRACT_LIMITER = anyio.CapacityLimiter(os.cpu_count() or 1)
 
 
-def _embed_text(text: str):
-    """Encode the uploaded text with the cached MiniLM embedder."""
+@functools.cache
+def get_embedder() -> EmbeddingModel:
+    """Return the process-wide MiniLM embedder, loading the model on first use."""
 
-    return _embedder.encode([text])[0]
+    if Config.EMBEDDING_BACKEND == "onnx":
+        # optional dependency; only imported when selected
+        from embedding.onnx_minilm import OnnxMiniLMEmbedder
+        return OnnxMiniLMEmbedder()
+    return MiniLMEmbedder()
 
 
-app = FastAPI()
+@functools.cache
+def get_embedding_cache() -> DiskEmbeddingCache:
+    """Return the process-wide query embedding cache."""
+
+    return DiskEmbeddingCache(Config.EMBEDDING_CACHE_PATH)
+
+
+# all-MiniLM-L6-v2 truncates its input at 256 word pieces, so only the start of a
+# document ever contributes to the query vector. 4000 characters comfortably covers
+# 256 tokens; cutting there keeps the tokenizer from walking megabytes of OCR text
+# that would be discarded anyway.
+QUERY_MAX_CHARS = 4000
+
+
+def _encode_batch(texts: list[str]) -> list[np.ndarray]:
+    """Encode a batch of texts with the cached MiniLM embedder (blocking)."""
+
+    return [np.asarray(vec, dtype=np.float32) for vec in get_embedder().encode(texts)]
+
+
+# concurrent searches share one forward pass instead of each running a batch of one
+_batcher = EmbeddingBatcher(_encode_batch)
+
+
+async def _embed_text(text: str):
+    """Encode the uploaded text with the cached MiniLM embedder.
+
+    Only the first QUERY_MAX_CHARS characters are embedded (the model's context
+    window); chunking long documents is out of scope here. Identical texts (e.g.
+    the same document uploaded twice) are served from the embedding cache
+    instead of re-running the model; misses are batched with other in-flight
+    searches.
+    """
+    text = text[:QUERY_MAX_CHARS]
+    embedder = get_embedder()
+    cache = get_embedding_cache()
+    key = embedding_key(embedder.model_name, embedder.dim, text)
+
+    vec = await anyio.to_thread.run_sync(cache.get, key)
+    if vec is None:
+        vec = await _batcher.embed(text)
+        await anyio.to_thread.run_sync(cache.set, key, vec)
+    return vec
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    open_pool()
+    # load the model and run one forward pass so the first search doesn't pay for it
+    await anyio.to_thread.run_sync(_encode_batch, ["warmup"])
+    await _batcher.start()
+    try:
+        yield
+    finally:
+        await _batcher.stop()
+        close_pool()
+
+
+# Similarity queries against the half-precision minilm_emb_h column
+# (migrations/003_minilm_emb_halfvec.sql). Kept as module constants so the SQL
+# text is identical on every request: psycopg keys its prepared-statement cache
+# on the query text.
+# ORDER BY repeats the raw <=> expression from the SELECT list (same parameter), so
+# postgres evaluates it once and can match it against an ANN index ordering.
+
+# With a path filter, search the denormalized file_contents_paths table
+# (migrations/005_file_contents_paths_table.sql, kept current by triggers on
+# file_contents/files/file_locations) so the HNSW index scan can apply the
+# directory filter while it walks the graph instead of after a separate join.
+# hnsw.iterative_scan = relaxed_order may return rows slightly out of distance
+# order, so the index scan sits in a MATERIALIZED CTE and the outer query sorts
+# its top_k rows by distance (pgvector's recommended pattern).
+SQL_WITH_FILTER = """
+    WITH nearest AS MATERIALIZED (
+        SELECT
+            file_hash,
+            file_server_directories,
+            filename,
+            (minilm_emb_h <=> %(query_vec)s::halfvec) AS distance
+        FROM file_contents_paths
+        WHERE file_server_directories LIKE %(path_filter)s
+        ORDER BY minilm_emb_h <=> %(query_vec)s::halfvec
+        LIMIT %(top_k)s
+    )
+    SELECT * FROM nearest ORDER BY distance;
+"""
+
+SQL_NO_FILTER = """
+    SELECT
+        fc.file_hash,
+        fl.file_server_directories,
+        fl.filename,
+        (fc.minilm_emb_h <=> %(query_vec)s::halfvec) AS distance
+    FROM file_contents fc
+    JOIN files f
+      ON f.hash = fc.file_hash
+    LEFT JOIN file_locations fl
+      ON fl.file_id = f.id
+    WHERE fc.minilm_emb_h IS NOT NULL
+    ORDER BY fc.minilm_emb_h <=> %(query_vec)s::halfvec
+    LIMIT %(top_k)s;
+"""
+
+
+app = FastAPI(lifespan=lifespan)
 templates = Jinja2Templates(directory="templates")
 
 
@@ -118,7 +235,7 @@ async def index_post(
             # extract_server_dirs returns relative path with forward slashes
             # We use include_filename=True because search_target_path is a directory, 
             # and we don't want to strip the last component.
-            relative_dir = extract_server_dirs(search_target_path, USER_SERVER_MOUNT_PATH, include_filename=True)
+            relative_dir = extract_server_dirs(search_target_path, Config.USER_SERVER_MOUNT_PATH, include_filename=True)
             
             if relative_dir == ".":
                 relative_dir = ""
@@ -127,121 +244,90 @@ async def index_post(
                 # We want to match anything starting with this directory
                 path_filter = relative_dir + "%"
         except ValueError:
-             error = f"Search target path must be under {USER_SERVER_MOUNT_PATH}"
+             error = f"Search target path must be under {Config.USER_SERVER_MOUNT_PATH}"
 
     if not error and (not file or not file.filename):
         error = "please choose a file."
     
     if not error:
-        temp_dir = tempfile.mkdtemp(prefix="upload_")
         safe_filename = os.path.basename(file.filename)
-        tmp_path = os.path.join(temp_dir, safe_filename)
-
-        # save uploaded file to a temp location that preserves its original name
-        content = await file.read()
-        with open(tmp_path, "wb") as tmp:
-            tmp.write(content)
 
-        try:
-            # 1) extract text using your existing pipeline
-            query_text = extract_and_normalize_text(tmp_path)
-
-            if not query_text or not query_text.strip():
-                error = "no text could be extracted from that file."
-            else:
-                # 2) embed text using your existing minilm embedding
-                query_vec = _embed_text(query_text)
-
-                # make sure it's a plain python list, psycopg wants that
-                query_vec = list(map(float, query_vec))
-
-                # 3) run similarity search in postgres
-                with get_connection() as conn:
-                    with conn.cursor() as cur:
-                        # using cosine distance (<=>) on minilm_emb
-                        # we also join to files + file_locations for paths
-
-                        # With a path filter, postgres first narrows the candidate set via file_locations,
-                        # then computes vector similarity on that subset.
-                        
-                        params = {
-                            "query_vec": query_vec,
-                            "top_k": Config.TOP_K,
-                        }
-
-                        if path_filter:
-                            params["path_filter"] = path_filter
-                            sql = """
-                                WITH candidate_files AS (
-                                    SELECT DISTINCT file_id 
-                                    FROM file_locations 
-                                    WHERE file_server_directories LIKE %(path_filter)s
-                                )
-                                SELECT
-                                    fc.file_hash,
-                                    fl.file_server_directories,
-                                    fl.filename,
-                                    (fc.minilm_emb <=> %(query_vec)s) AS distance
-                                FROM file_contents fc
-                                JOIN files f ON f.hash = fc.file_hash
-                                JOIN candidate_files cf ON cf.file_id = f.id
-                                LEFT JOIN file_locations fl ON fl.file_id = f.id
-                                WHERE fc.minilm_emb IS NOT NULL
-                                ORDER BY distance
-                                LIMIT %(top_k)s;
-                            """
-                        else:
-                            sql = """
-                                SELECT
-                                    fc.file_hash,
-                                    fl.file_server_directories,
-                                    fl.filename,
-                                    (fc.minilm_emb <=> %(query_vec)s) AS distance
-                                FROM file_contents fc
-                                JOIN files f
-                                  ON f.hash = fc.file_hash
-                                LEFT JOIN file_locations fl
-                                  ON fl.file_id = f.id
-                                WHERE fc.minilm_emb IS NOT NULL
-                                ORDER BY distance
-                                LIMIT %(top_k)s;
-                            """
-
-                        cur.execute(sql, params)
-                        rows = cur.fetchall()
-
-                # 4) post-process rows and build full paths
-                for row in rows:
-                    directory = row.get("file_server_directories") or ""
-                    filename = row.get("filename") or ""
-                    distance = row.get("distance")
-
-                    # normalize separators a bit; you can tweak for your env
-                    # Use USER_SERVER_MOUNT_PATH as the root
-                    pieces = [p for p in [USER_SERVER_MOUNT_PATH, directory, filename] if p]
-                    full_path = os.path.join(*pieces) if pieces else ""
-
-                    results.append(
-                        {
-                            "file_hash": row["file_hash"],
-                            "directory": directory,
-                            "filename": filename,
-                            "full_path": full_path,
-                            "distance": float(distance) if distance is not None else None,
-                        }
+        # the upload only needs to exist until its text is extracted; the directory
+        # and everything in it is removed on exit, including on errors
+        with tempfile.TemporaryDirectory(prefix="upload_", ignore_cleanup_errors=True) as temp_dir:
+            tmp_path = os.path.join(temp_dir, safe_filename)
+
+            # save uploaded file to a temp location that preserves its original name,
+            # copying in chunks so large uploads never sit in memory whole
+            async with await anyio.open_file(tmp_path, "wb") as tmp:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await tmp.write(chunk)
+
+            # 1) extract text using your existing pipeline (parsing/OCR/Tika block, so off the loop)
+            query_text = await anyio.to_thread.run_sync(
+                extract_and_normalize_text, tmp_path, limiter=_EXTRACT_LIMITER
+            )
+
+        if not query_text or not query_text.strip():
+            error = "no text could be extracted from that file."
+        else:
+            # 2) embed text using your existing minilm embedding
+            query_vec = await _embed_text(query_text)
+
+            # query_vec stays a float32 ndarray; register_vector (db.py) sends it
+            # to postgres in pgvector's binary format
+
+            # 3) run similarity search in postgres
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    # using cosine distance (<=>) on minilm_emb_h
+                    # we also join to files + file_locations for paths
+                    params = {
+                        "query_vec": query_vec,
+                        "top_k": Config.TOP_K,
+                    }
+
+                    # transaction-local hnsw settings (SET can't take bind parameters)
+                    cur.execute(
+                        "SELECT set_config('hnsw.ef_search', %s, true)",
+                        (str(Config.HNSW_EF_SEARCH),),
                     )
 
-        finally:
-            # clean up temp file and containing directory
-            try:
-                os.remove(tmp_path)
-            except OSError:
-                pass
-
-            try:
-                os.rmdir(temp_dir)
-            except OSError:
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                    if path_filter:
+                        params["path_filter"] = path_filter
+                        sql = SQL_WITH_FILTER
+                        if Config.HNSW_ITERATIVE_SCAN:
+                            # keep scanning the index until enough rows pass the path filter
+                            cur.execute(
+                                "SELECT set_config('hnsw.iterative_scan', %s, true)",
+                                (Config.HNSW_ITERATIVE_SCAN,),
+                            )
+                    else:
+                        sql = SQL_NO_FILTER
+
+                    cur.execute(sql, params)
+                    rows = cur.fetchall()
+
+            # 4) post-process rows and build full paths
+            for row in rows:
+                directory = row.get("file_server_directories") or ""
+                filename = row.get("filename") or ""
+                distance = row.get("distance")
+
+                # normalize separators a bit; you can tweak for your env
+                # Use Config.USER_SERVER_MOUNT_PATH as the root
+                pieces = [p for p in [Config.USER_SERVER_MOUNT_PATH, directory, filename] if p]
+                full_path = os.path.join(*pieces) if pieces else ""
+
+                results.append(
+                    {
+                        "file_hash": row["file_hash"],
+                        "directory": directory,
+                        "filename": filename,
+                        "full_path": full_path,
+                        "distance": float(distance) if distance is not None else None,
+                    }
+                )
 
     return templates.TemplateResponse(
         "index.html",
@@ -1,14 +1,30 @@
-import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 from pgvector.psycopg import register_vector  # pip install pgvector
 
 from config import Config
 
+# one pool per process; register_vector runs once per pooled connection
+# instead of once per request. opened/closed by the app lifespan.
+_pool = ConnectionPool(
+    Config.DATABASE_URL,
+    min_size=2,
+    max_size=10,
+    # prepare on first execution: each pooled connection plans the search SQL once
+    kwargs={"row_factory": dict_row, "prepare_threshold": 1},
+    configure=register_vector,
+    open=False,
+)
+
+
+def open_pool():
+    _pool.open()
+
+
+def close_pool():
+    _pool.close()
+
+
 def get_connection():
-    # simple one-shot connection; for real app you'd pool or stick on flask.g
-    conn = psycopg.connect(
-        Config.DATABASE_URL,
-        row_factory=dict_row,
-    )
-    register_vector(conn)
-    return conn
\ No newline at end of file
+    # context manager: commits (or rolls back) and returns the connection to the pool on exit
+    return _pool.connection()
@@ -2,7 +2,7 @@
 
 import logging
 import numpy as np
-from typing import List, Sequence
+from typing import Sequence
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,18 @@ class EmbeddingModel(ABC):
     model_name: str
 
     @abstractmethod
-    def encode(self, texts: Sequence[str]) -> List[np.ndarray]:
-        """Return list of L2-normalised vectors."""
-        raise NotImplementedError("Subclasses should implement this method.")
\ No newline at end of file
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a (len(texts), dim) array of L2-normalised float32 vectors.
+
+        float32 is pgvector's native width, so vectors can be handed to psycopg
+        (with register_vector) without conversion.
+        """
+        raise NotImplementedError("Subclasses should implement this method.")
+
+    def _debug_check(self, embeddings) -> None:
+        """Verify the encode contract when debug logging is on (skipped otherwise)."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        for vec in embeddings:
+            assert vec.dtype == np.float32, f"{self.model_name} produced {vec.dtype}, expected float32"
+            assert vec.shape == (self.dim,), f"{self.model_name} produced shape {vec.shape}, expected ({self.dim},)"
\ No newline at end of file
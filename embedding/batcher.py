@@ -0,0 +1,101 @@
+# embedding/batcher.py  –– Async micro-batching front end for an embedding model
+
+import asyncio
+import logging
+import numpy as np
+from typing import Callable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX = 8
+BATCH_TIMEOUT = 0.05  # seconds
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent single-text embedding requests into batched encode calls.
+
+    Requests are queued; a background task takes the first waiting request,
+    gathers more for up to `timeout` seconds or until `max_batch` are queued,
+    runs one `encode(texts)` call in a worker thread and resolves each caller's
+    future with its own vector. One matmul over the batch is much cheaper than
+    the same number of batch-of-one forward passes.
+
+    Attributes:
+        encode: Blocking function mapping a list of texts to a list of vectors
+        max_batch: Largest number of texts sent to encode at once
+        timeout: How long to wait for more requests after the first one arrives
+    """
+    def __init__(self,
+                 encode: Callable[[List[str]], Sequence[np.ndarray]],
+                 max_batch: int = BATCH_MAX,
+                 timeout: float = BATCH_TIMEOUT):
+        self.encode = encode
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start the background batching task on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the batching task and fail any requests still waiting."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._queue is not None and not self._queue.empty():
+            _, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.set_exception(RuntimeError("EmbeddingBatcher stopped"))
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Queue one text and wait for its vector.
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            np.ndarray: The embedding produced by `encode`
+        """
+        if self._task is None:
+            raise RuntimeError("EmbeddingBatcher.start() has not been called")
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.timeout
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            logger.debug(f"Encoding batch of {len(texts)} texts")
+            try:
+                vecs = await asyncio.to_thread(self.encode, texts)
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+
+            for (_, fut), vec in zip(batch, vecs):
+                # the caller may have gone away (client disconnect cancels its await)
+                if not fut.done():
+                    fut.set_result(vec)
@@ -0,0 +1,113 @@
+# embedding/cache.py  –– Two-tier (memory + SQLite) cache for embedding vectors
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import numpy as np
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_key(model_name: str, dim: int, text: str) -> bytes:
+    """
+    Build the cache key for a text embedded by a given model.
+
+    The model name and dimension are hashed together with the text so vectors
+    from different models can never collide in a shared cache file.
+
+    Args:
+        model_name: Name of the embedding model
+        dim: Dimension of the vectors the model produces
+        text: The (normalized) text being embedded
+
+    Returns:
+        bytes: 32-byte SHA-256 digest
+    """
+    h = hashlib.sha256(f"{model_name}:{dim}:".encode("utf-8"))
+    h.update(text.encode("utf-8"))
+    return h.digest()
+
+
+class DiskEmbeddingCache:
+    """
+    Embedding cache with an in-process LRU tier in front of a SQLite table.
+
+    Lookups check the memory tier first, then the database; database hits are
+    promoted into memory. Both tiers store float16, which halves the footprint
+    and read bandwidth per entry and is lossless enough for cosine ranking of
+    unit-length vectors. Because both tiers hold the same values, a key returns
+    the same vector whichever tier answers. get() converts to a fresh float32
+    array.
+
+    Attributes:
+        path: Location of the SQLite database file
+        memory_size: Maximum number of vectors kept in the memory tier (LRU-evicted)
+    """
+    def __init__(self, path: str | Path, memory_size: int = 50_000):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.memory_size = memory_size
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        # lookups happen from worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # float16 blobs; a separate table so float32 rows written by older
+        # versions (table "emb") are never decoded with the wrong width
+        self._conn.execute("CREATE TABLE IF NOT EXISTS emb_f16 (hash BLOB PRIMARY KEY, vec BLOB)")
+        self._conn.commit()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        """
+        Return the cached vector for key, or None on a miss.
+        """
+        with self._lock:
+            vec = self._memory.get(key)
+            if vec is not None:
+                self._memory.move_to_end(key)
+                return vec.astype(np.float32)
+
+            row = self._conn.execute("SELECT vec FROM emb_f16 WHERE hash = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            vec = np.frombuffer(row[0], dtype=np.float16)
+            self._remember(key, vec)
+            return vec.astype(np.float32)
+
+    def set(self, key: bytes, vec: np.ndarray) -> None:
+        """
+        Store vec under key in both tiers.
+        """
+        vec = np.asarray(vec).astype(np.float16)
+        with self._lock:
+            self._remember(key, vec)
+            self._conn.execute("INSERT OR REPLACE INTO emb_f16 (hash, vec) VALUES (?, ?)", (key, vec.tobytes()))
+            self._conn.commit()
+
+    def set_many(self, items) -> None:
+        """
+        Store several (key, vec) pairs in one transaction.
+        """
+        rows = [(key, np.asarray(vec).astype(np.float16)) for key, vec in items]
+        with self._lock:
+            for key, vec in rows:
+                self._remember(key, vec)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO emb_f16 (hash, vec) VALUES (?, ?)",
+                [(key, vec.tobytes()) for key, vec in rows],
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: bytes, vec: np.ndarray) -> None:
+        self._memory[key] = vec
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
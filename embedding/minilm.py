@@ -2,7 +2,9 @@
 
 import logging
 import numpy as np
+import torch
 from .base import EmbeddingModel
+from .cache import DiskEmbeddingCache, embedding_key
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
@@ -17,31 +19,78 @@ class MiniLMEmbedder(EmbeddingModel):
     
     Attributes:
         model: The underlying SentenceTransformer model
+        device: Torch device the model runs on ("cuda" when available, else "cpu")
         dim: The dimension of the embeddings produced by the model
         encoding_params: Additional parameters to pass to the encoding function
+        cache: Optional embedding cache; texts already in it skip the model
     """
-    def __init__(self, encoding_params={}):
+    def __init__(self, encoding_params={}, device: str | None = None, fp16: bool = True,
+                 cache: DiskEmbeddingCache | None = None):
         self.model_name: str = 'all-MiniLM-L6-v2'
-        self.model: SentenceTransformer = SentenceTransformer(self.model_name)
+        self.device: str = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.model: SentenceTransformer = SentenceTransformer(self.model_name, device=self.device)
+        if fp16 and self.device.startswith("cuda"):
+            # half-precision weights run on tensor cores; outputs are cast back in encode
+            self.model.half()
+        logger.info(f"Loaded {self.model_name} on {self.device}{' (fp16)' if fp16 and self.device.startswith('cuda') else ''}")
         self.dim: int = self.model.get_sentence_embedding_dimension()
-        self.encoding_params: dict = encoding_params
+        # numpy output, unit-length vectors; callers may override either
+        self.encoding_params: dict = {"convert_to_numpy": True, "normalize_embeddings": True, **encoding_params}
+        self.cache = cache
         
 
-    def encode(self, texts):
+    def encode(self, texts, batch_size: int = 64):
         """
         Encode the provided texts into embeddings.
         
+        SentenceTransformer already length-sorts the inputs and pads each
+        mini-batch only to its longest member, so larger batches cost little
+        extra padding.
+
+        With a cache configured, only texts missing from it are run through the
+        model; re-indexing an unchanged corpus then costs no forward passes.
+
         Args:
             texts: A sequence of strings to be encoded
+            batch_size: Number of texts per forward pass
             
         Returns:
-            List[np.ndarray]: A list of L2-normalized embedding vectors
+            np.ndarray: Array of shape (len(texts), dim) holding one L2-normalized
+            float32 embedding per row, in input order
         """
-        # The SentenceTransformer model.encode method already returns L2-normalized vectors
-        embeddings = self.model.encode(texts, **self.encoding_params)
-        
-        # Convert to list of numpy arrays if it's not already in that format
-        if isinstance(embeddings, np.ndarray) and len(embeddings.shape) == 2:
-            embeddings = [embedding for embedding in embeddings]
-            
+        if self.cache is not None:
+            return self._encode_cached(list(texts), batch_size)
+
+        params = {"show_progress_bar": False, **self.encoding_params, "batch_size": batch_size}
+        embeddings = self.model.encode(texts, **params)
+
+        # keep the contiguous 2-D array; rows iterate/index like the old list of vectors.
+        # fp16 models emit float16, so this cast is also what restores float32 there.
+        if isinstance(embeddings, np.ndarray):
+            embeddings = embeddings.astype(np.float32, copy=False)
+
+        self._debug_check(embeddings)
+        return embeddings
+
+    def _encode_cached(self, texts, batch_size):
+        keys = [embedding_key(self.model_name, self.dim, text) for text in texts]
+        embeddings = np.empty((len(texts), self.dim), dtype=np.float32)
+
+        miss_idx = []
+        for i, key in enumerate(keys):
+            vec = self.cache.get(key)
+            if vec is None:
+                miss_idx.append(i)
+            else:
+                embeddings[i] = vec
+
+        if miss_idx:
+            params = {"show_progress_bar": False, **self.encoding_params,
+                      "batch_size": batch_size, "convert_to_numpy": True}
+            computed = self.model.encode([texts[i] for i in miss_idx], **params)
+            embeddings[miss_idx] = computed
+            self.cache.set_many((keys[i], embeddings[i]) for i in miss_idx)
+        logger.debug(f"Embedding cache: {len(texts) - len(miss_idx)} hits, {len(miss_idx)} misses")
+
+        self._debug_check(embeddings)
         return embeddings
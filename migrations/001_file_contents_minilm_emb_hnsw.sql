@@ -0,0 +1,10 @@
+-- HNSW index for cosine similarity search on file_contents.minilm_emb.
+-- Without it every search is a sequential scan + top-N sort over the whole table.
+--
+-- CONCURRENTLY cannot run inside a transaction block; run this file with
+-- autocommit on, e.g. `psql "$DATABASE_URL" -f migrations/001_file_contents_minilm_emb_hnsw.sql`.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS file_contents_minilm_emb_hnsw
+    ON file_contents
+    USING hnsw (minilm_emb vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,33 @@
+-- Denormalized (file_hash, location, embedding) rows for path-filtered searches.
+--
+-- The filtered search used to narrow file_locations first and then join back to
+-- file_contents, which keeps the HNSW index on file_contents.minilm_emb out of the
+-- plan. Here the path column and the embedding live in the same relation, so the
+-- index scan can apply the LIKE filter itself (hnsw.iterative_scan, pgvector >= 0.8).
+--
+-- The ingest pipeline must refresh the view after adding files:
+--     REFRESH MATERIALIZED VIEW CONCURRENTLY file_contents_paths;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS file_contents_paths AS
+SELECT
+    fc.file_hash,
+    fl.file_server_directories,
+    fl.filename,
+    fc.minilm_emb
+FROM file_contents fc
+JOIN files f ON f.hash = fc.file_hash
+JOIN file_locations fl ON fl.file_id = f.id
+WHERE fc.minilm_emb IS NOT NULL;
+
+-- required by REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS file_contents_paths_location_idx
+    ON file_contents_paths (file_server_directories, filename);
+
+-- prefix LIKE 'dir/%' needs text_pattern_ops unless the database uses the C collation
+CREATE INDEX IF NOT EXISTS file_contents_paths_dir_pattern_idx
+    ON file_contents_paths (file_server_directories text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS file_contents_paths_minilm_emb_hnsw
+    ON file_contents_paths
+    USING hnsw (minilm_emb vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,45 @@
+-- Half-precision (halfvec) copy of the MiniLM embeddings for search.
+--
+-- halfvec halves the bytes per vector, so the HNSW graph is ~half the size and
+-- each distance computation reads half the memory; recall loss at 384 dims is
+-- negligible. minilm_emb stays the source of truth: the halfvec column is
+-- generated from it, so ingest code does not change.
+--
+-- Contains CONCURRENTLY statements; run with autocommit on (plain `psql -f`).
+
+ALTER TABLE file_contents
+    ADD COLUMN IF NOT EXISTS minilm_emb_h halfvec(384)
+    GENERATED ALWAYS AS (minilm_emb::halfvec(384)) STORED;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS file_contents_minilm_emb_h_hnsw
+    ON file_contents
+    USING hnsw (minilm_emb_h halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- superseded by the halfvec index above
+DROP INDEX CONCURRENTLY IF EXISTS file_contents_minilm_emb_hnsw;
+
+-- rebuild the path-filter view on the halfvec column
+DROP MATERIALIZED VIEW IF EXISTS file_contents_paths;
+
+CREATE MATERIALIZED VIEW file_contents_paths AS
+SELECT
+    fc.file_hash,
+    fl.file_server_directories,
+    fl.filename,
+    fc.minilm_emb_h
+FROM file_contents fc
+JOIN files f ON f.hash = fc.file_hash
+JOIN file_locations fl ON fl.file_id = f.id
+WHERE fc.minilm_emb_h IS NOT NULL;
+
+CREATE UNIQUE INDEX file_contents_paths_location_idx
+    ON file_contents_paths (file_server_directories, filename);
+
+CREATE INDEX file_contents_paths_dir_pattern_idx
+    ON file_contents_paths (file_server_directories text_pattern_ops);
+
+CREATE INDEX file_contents_paths_minilm_emb_h_hnsw
+    ON file_contents_paths
+    USING hnsw (minilm_emb_h halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
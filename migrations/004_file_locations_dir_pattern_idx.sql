@@ -0,0 +1,12 @@
+-- Prefix-searchable index on file_locations.file_server_directories.
+--
+-- A default btree uses the database collation and can't serve LIKE 'dir/%'
+-- (unless the collation is C), so prefix lookups on file_locations fall back to
+-- a sequential scan. text_pattern_ops compares byte-wise and turns the prefix
+-- into an index range scan. The path-filtered search itself reads
+-- file_contents_paths, which carries the same kind of index (002/003/005).
+--
+-- CONCURRENTLY: run with autocommit on (plain `psql -f`).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS file_locations_dir_pattern_idx
+    ON file_locations (file_server_directories text_pattern_ops);
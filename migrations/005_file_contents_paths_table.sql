@@ -0,0 +1,96 @@
+-- Keep file_contents_paths current on write instead of as a materialized view.
+--
+-- The materialized view from 002/003 only changed on REFRESH, and nothing ran
+-- one, so files ingested after the migration never showed up in path-filtered
+-- searches. It is replaced by a plain table with the same columns, maintained by
+-- triggers on file_contents, file_locations and files. Each change rebuilds the
+-- rows of the affected file_hash, so ingest code does not change.
+
+DROP MATERIALIZED VIEW IF EXISTS file_contents_paths;
+
+CREATE TABLE IF NOT EXISTS file_contents_paths AS
+SELECT
+    fc.file_hash,
+    fl.file_server_directories,
+    fl.filename,
+    fc.minilm_emb_h
+FROM file_contents fc
+JOIN files f ON f.hash = fc.file_hash
+JOIN file_locations fl ON fl.file_id = f.id
+WHERE fc.minilm_emb_h IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS file_contents_paths_hash_idx
+    ON file_contents_paths (file_hash);
+
+-- prefix LIKE 'dir/%' needs text_pattern_ops unless the database uses the C collation
+CREATE INDEX IF NOT EXISTS file_contents_paths_dir_pattern_idx
+    ON file_contents_paths (file_server_directories text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS file_contents_paths_minilm_emb_h_hnsw
+    ON file_contents_paths
+    USING hnsw (minilm_emb_h halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- rebuild the rows of one file hash from the base tables
+CREATE OR REPLACE FUNCTION refresh_file_contents_paths(h file_contents.file_hash%TYPE)
+RETURNS void LANGUAGE sql AS $$
+    DELETE FROM file_contents_paths WHERE file_hash = h;
+    INSERT INTO file_contents_paths (file_hash, file_server_directories, filename, minilm_emb_h)
+    SELECT fc.file_hash, fl.file_server_directories, fl.filename, fc.minilm_emb_h
+    FROM file_contents fc
+    JOIN files f ON f.hash = fc.file_hash
+    JOIN file_locations fl ON fl.file_id = f.id
+    WHERE fc.file_hash = h AND fc.minilm_emb_h IS NOT NULL;
+$$;
+
+CREATE OR REPLACE FUNCTION file_contents_paths_on_contents() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_file_contents_paths(OLD.file_hash);
+    END IF;
+    IF TG_OP <> 'DELETE' AND (TG_OP = 'INSERT' OR NEW.file_hash IS DISTINCT FROM OLD.file_hash) THEN
+        PERFORM refresh_file_contents_paths(NEW.file_hash);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION file_contents_paths_on_files() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM refresh_file_contents_paths(OLD.hash);
+    IF TG_OP = 'UPDATE' AND NEW.hash IS DISTINCT FROM OLD.hash THEN
+        PERFORM refresh_file_contents_paths(NEW.hash);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION file_contents_paths_on_locations() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM refresh_file_contents_paths(f.hash) FROM files f WHERE f.id = OLD.file_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM refresh_file_contents_paths(f.hash) FROM files f WHERE f.id = NEW.file_id;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS file_contents_paths_sync ON file_contents;
+CREATE TRIGGER file_contents_paths_sync
+    AFTER INSERT OR DELETE OR UPDATE OF file_hash, minilm_emb ON file_contents
+    FOR EACH ROW EXECUTE FUNCTION file_contents_paths_on_contents();
+
+DROP TRIGGER IF EXISTS file_contents_paths_sync ON files;
+CREATE TRIGGER file_contents_paths_sync
+    AFTER DELETE OR UPDATE OF hash ON files
+    FOR EACH ROW EXECUTE FUNCTION file_contents_paths_on_files();
+
+DROP TRIGGER IF EXISTS file_contents_paths_sync ON file_locations;
+CREATE TRIGGER file_contents_paths_sync
+    AFTER INSERT OR DELETE OR UPDATE OF file_id, file_server_directories, filename ON file_locations
+    FOR EACH ROW EXECUTE FUNCTION file_contents_paths_on_locations();
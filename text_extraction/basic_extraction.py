@@ -1,18 +1,36 @@
 # text_extraction/extractors.py
 
+import anyio
+import codecs
+import functools
 import httpx
+import io
 import logging
 import os
 import markdown
 import re
+import zlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, date
 from pathlib import Path
-from .extraction_utils import validate_file, strip_html
-from typing import List
+from .extraction_utils import validate_file, strip_html, strip_xml
+from typing import Dict, List
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+try:
+    import hyperscan  # optional multi-pattern DFA scanner for DateExtractor
+    _HAS_HYPERSCAN = True
+except ImportError:
+    _HAS_HYPERSCAN = False
+
 class FileTextExtractor(ABC):
     """
     Abstract base class for text extraction from different file types.
@@ -49,7 +67,60 @@ class FileTextExtractor(ABC):
         """
         raise NotImplementedError("Subclasses should implement this method.")
 
+    async def aextract(self, path: str) -> str:
+        """
+        Async variant of __call__; the blocking extraction runs in a worker thread.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file from which to extract text.
+
+        Returns
+        -------
+        str
+            Extracted text content from the file.
+        """
+        return await anyio.to_thread.run_sync(self, path)
+
+    async def aextract_many(self, paths: List[str], concurrency: int = 8) -> List[str]:
+        """
+        Extract many files from one event loop, at most `concurrency` at a time.
+
+        Parameters
+        ----------
+        paths : list[str]
+            Files to extract.
+        concurrency : int, optional
+            Maximum number of extractions in flight, by default 8.
+
+        Returns
+        -------
+        list[str]
+            Extracted text per path, in input order. Failures are logged and
+            yield "", as in batch_extract.
+        """
+        results = [""] * len(paths)
+        sem = anyio.Semaphore(concurrency)
+
+        async def run(i: int, path: str) -> None:
+            async with sem:
+                try:
+                    results[i] = await self.aextract(path) or ""
+                except Exception as e:
+                    logger.error(f"Extraction failed for {path}: {e}")
+
+        async with anyio.create_task_group() as tg:
+            for i, path in enumerate(paths):
+                tg.start_soon(run, i, path)
+        return results
+
   
+# TextFileTextExtractor reads files above this size incrementally
+LARGE_TEXT_FILE_BYTES = 10 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+
 class TextFileTextExtractor(FileTextExtractor):
     """
     Extract text from plain text files.
@@ -89,27 +160,56 @@ class TextFileTextExtractor(FileTextExtractor):
         # validate file path and type
         file_path = validate_file(path)
         logger.debug(f"Validated file path: {file_path}")
+
+        if file_path.suffix.lower() == ".xml":
+            # streamed straight from disk; the XML declaration decides the encoding
+            logger.debug(f"Stripping XML content from file: {file_path}")
+            return strip_xml(file_path)
         
-        # Try different encodings
+        text = self._read_text(file_path)
+        if text is None:
+            # If we get here, none of the encodings worked
+            raise ValueError(f"Unable to read file with supported encodings: {path}")
+
+        if file_path.suffix.lower() == ".md":
+            logger.debug(f"Converting Markdown to HTML for file: {file_path}")
+            return strip_html(markdown.markdown(text))
+        return text
+
+    def _read_text(self, file_path: Path) -> str | None:
+        """
+        Decode the file with the first of self.encodings that succeeds.
+
+        Files up to LARGE_TEXT_FILE_BYTES are read from disk once and each
+        encoding is tried on the in-memory bytes. Larger files are decoded in
+        READ_CHUNK_SIZE pieces so the raw bytes are never held whole; the file is
+        re-read only if an encoding fails. Newlines are translated as text-mode
+        open() does.
+
+        Returns
+        -------
+        str or None
+            Decoded text, or None if no encoding could decode the file.
+        """
+        large = file_path.stat().st_size > LARGE_TEXT_FILE_BYTES
+        data = None if large else file_path.read_bytes()
+
         for encoding in self.encodings:
             logger.debug(f"Trying encoding: {encoding} for file: {file_path}")
+            decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
             try:
-                with open(file_path, 'r', encoding=encoding) as file: #TODO:  errors='ignore'?
-                    if file_path.suffix.lower() == ".xml":
-                        logger.debug(f"Stripping XML content from file: {file_path}")
-                        return strip_html(file.read(), parser="xml")
-                    
-                    elif file_path.suffix.lower() == ".md":
-                        logger.debug(f"Converting Markdown to HTML for file: {file_path}")
-                        text = markdown.markdown(file.read())
-                        return strip_html(text, parser="html")
-
-                    return file.read()
+                if data is not None:
+                    return decoder.decode(data, final=True)
+
+                parts = []
+                with open(file_path, "rb") as file:
+                    while chunk := file.read(READ_CHUNK_SIZE):
+                        parts.append(decoder.decode(chunk))
+                parts.append(decoder.decode(b"", final=True))
+                return "".join(parts)
             except UnicodeDecodeError:
                 continue
-        
-        # If we get here, none of the encodings worked
-        raise ValueError(f"Unable to read file with supported encodings: {path}")
+        return None
 
 
 class TikaUnsupportedError(Exception):
@@ -138,50 +238,93 @@ class TikaTextExtractor(FileTextExtractor):
         'odt','ods'
     ]
 
-    def __init__(self, server_url: str | None = None, timeout: int = 60):
+    # formats that compress well enough to be worth gzipping on upload
+    gzip_extensions = {'html', 'htm', 'xml', 'csv', 'txt', 'json', 'md'}
+
+    def __init__(self, server_url: str | None = None, timeout: int = 60, max_connections: int = 32,
+                 gzip_upload: bool = False):
         super().__init__()
         # e.g. "http://localhost:9998"
         self.server_url = server_url or os.environ.get('TIKA_SERVER_URL', 'http://localhost:9998')
         self.tika_endpoint = f"{self.server_url}/tika"
-        self.detect_endpoint = f"{self.server_url}/detect/stream"
+        # detected MIME type and text in one response, so each file is uploaded once
+        self.rmeta_endpoint = f"{self.server_url}/rmeta/text"
         self.timeout = timeout
+        # opt-in: needs a Tika server that accepts Content-Encoding: gzip request bodies
+        self.gzip_upload = gzip_upload
+
+        # one pooled client reused for every file: keep-alive skips a TCP (and TLS)
+        # handshake per request, and HTTP/2 multiplexes when h2 is installed
+        self._limits = httpx.Limits(max_keepalive_connections=max_connections, max_connections=max_connections)
+        self._client = httpx.Client(http2=_HAS_H2, timeout=self.timeout, limits=self._limits)
+        self._async_client: httpx.AsyncClient | None = None
 
         # sanity check server is up
-        r = httpx.get(self.tika_endpoint, headers={'Accept': 'text/plain'}, timeout=self.timeout)
+        r = self._client.get(self.tika_endpoint, headers={'Accept': 'text/plain'})
         r.raise_for_status()
 
-    def _detect_mime(self, path: Path) -> str:
-        # filename hint improves detection
-        with open(path, 'rb') as fh:
-            r = httpx.put(
-                self.detect_endpoint,
-                content=fh,
-                headers={'Content-Disposition': f'attachment; filename=\"{path.name}\"'},
-                timeout=self.timeout
-            )
-        r.raise_for_status()
-        return (r.text or '').strip()
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if aextract created one."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def __call__(self, path: str) -> str:
         p = validate_file(path)
-        # Preflight: detect MIME
-        mime = self._detect_mime(p)
-        logger.debug(f"Tika detected MIME for {p}: {mime or 'UNKNOWN'}")
+        logger.info(f"Extracting text from {p} with Tika")
+        gzip_body = self._gzip_body(p)
+        # a generator body is sent with chunked transfer encoding, so the file is
+        # never buffered whole in memory
+        resp = self._client.put(
+            self.rmeta_endpoint,
+            content=_iter_file(p, gzip_body=gzip_body),
+            headers=self._headers(p, gzip_body),
+        )
+        return self._handle_response(resp, p)
+
+    async def aextract(self, path: str) -> str:
+        """
+        Async variant of __call__, so callers can keep many files in flight
+        against the Tika server from one event loop.
+        """
+        p = validate_file(path)
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(http2=_HAS_H2, timeout=self.timeout, limits=self._limits)
+
+        logger.info(f"Extracting text from {p} with Tika")
+        gzip_body = self._gzip_body(p)
+        resp = await self._async_client.put(
+            self.rmeta_endpoint,
+            content=_aiter_file(p, gzip_body=gzip_body),
+            headers=self._headers(p, gzip_body),
+        )
+        return self._handle_response(resp, p)
 
+    def _gzip_body(self, p: Path) -> bool:
+        return self.gzip_upload and p.suffix.lower().lstrip('.') in self.gzip_extensions
+
+    @staticmethod
+    def _headers(p: Path, gzip_body: bool = False) -> dict:
+        # filename hint improves detection
+        headers = {
+            'Accept': 'application/json',
+            'Content-Disposition': f'attachment; filename=\"{p.name}\"',
+        }
+        if gzip_body:
+            headers['Content-Encoding'] = 'gzip'
+        return headers
+
+    @staticmethod
+    def _check_mime(p: Path, mime: str) -> None:
         # Fast-fail on clearly unknown/opaque types
         if not mime or mime == 'application/octet-stream':
             raise TikaUnsupportedError(f"Tika can’t determine a usable MIME type for {p}")
 
-        logger.info(f"Extracting text from {p} with Tika (MIME={mime})")
-        # Extract text
-        with open(p, 'rb') as fh:
-            resp = httpx.put(
-                self.tika_endpoint,
-                content=fh,
-                headers={'Accept': 'text/plain'},
-                timeout=self.timeout
-            )
-
+    def _handle_response(self, resp: httpx.Response, p: Path) -> str:
         # Explicit handling of common outcomes
         if resp.status_code == 204:
             raise TikaNoContentError(f"Tika returned 204 No Content for {p}")
@@ -190,12 +333,66 @@ class TikaTextExtractor(FileTextExtractor):
 
         resp.raise_for_status()
 
-        text = resp.text or ""
+        # one metadata dict per document: the file itself first, then any
+        # embedded documents (which /tika would have inlined into its text)
+        docs = resp.json() or [{}]
+        mime = (docs[0].get('Content-Type') or '').split(';')[0].strip()
+        logger.debug(f"Tika detected MIME for {p}: {mime or 'UNKNOWN'}")
+        self._check_mime(p, mime)
+
+        text = "\n".join(c for d in docs if (c := d.get('X-TIKA:content')))
         if not text.strip():
             logger.warning(f"Tika returned 200 but empty body for {p} (MIME={mime})")
         return text
-    
-def get_extractor_for_file(file_path: str, extractors: list) -> FileTextExtractor:
+
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _iter_file(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE, gzip_body: bool = False):
+    """Yield a file's bytes in chunks (upload body), optionally gzip-compressed."""
+    compressor = zlib.compressobj(wbits=31) if gzip_body else None  # wbits=31: gzip container
+    with open(path, 'rb') as fh:
+        while chunk := fh.read(chunk_size):
+            yield compressor.compress(chunk) if compressor else chunk
+    if compressor:
+        yield compressor.flush()
+
+
+async def _aiter_file(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE, gzip_body: bool = False):
+    """Async _iter_file: reads without blocking the event loop (AsyncClient upload body)."""
+    compressor = zlib.compressobj(wbits=31) if gzip_body else None
+    async with await anyio.open_file(path, 'rb') as fh:
+        while chunk := await fh.read(chunk_size):
+            yield compressor.compress(chunk) if compressor else chunk
+    if compressor:
+        yield compressor.flush()
+
+
+def build_extractor_map(extractors: list) -> Dict[str, FileTextExtractor]:
+    """
+    Index extractor instances by the file extensions they handle.
+
+    Parameters
+    ----------
+    extractors : list
+        List of extractor instances, in priority order.
+
+    Returns
+    -------
+    dict
+        Mapping of lowercase extension (no dot) to extractor. When several
+        extractors claim an extension, the first one in the list wins, matching
+        the order get_extractor_for_file would scan them in.
+    """
+    extractor_map = {}
+    for extractor in extractors:
+        for ext in extractor.file_extensions:
+            extractor_map.setdefault(ext.lower(), extractor)
+    return extractor_map
+
+
+def get_extractor_for_file(file_path: str, extractors: list | Dict[str, FileTextExtractor]) -> FileTextExtractor:
     """
     Determine the appropriate extractor for a given file based on its extension.
 
@@ -203,29 +400,205 @@ def get_extractor_for_file(file_path: str, extractors: list) -> FileTextExtracto
     ----------
     file_path : str
         Path to the file to be processed.
-    extractors : list
-        List of extractor instances.
+    extractors : list or dict
+        List of extractor instances, or a prebuilt extension map from
+        build_extractor_map (a single dict lookup instead of a scan).
 
     Returns
     -------
     FileTextExtractor
-        The extractor instance that matches the file extension.
-
-    Raises
-    ------
-    ValueError
-        If no extractor matches the file extension.
+        The extractor instance that matches the file extension, or None if no
+        extractor handles it.
     """
     logger.debug(f"Finding extractor for file: {file_path}")
-    file_extension = Path(file_path).suffix.lower().lstrip(".")
-    for extractor in extractors:
-        if file_extension in extractor.file_extensions:
+    file_extension = os.path.splitext(file_path)[1].lower().lstrip(".")
+    if isinstance(extractors, dict):
+        extractor = extractors.get(file_extension)
+        if extractor is not None:
             logger.debug(f"Selected extractor {extractor.__class__.__name__} for file: {file_path}")
             return extractor
+    else:
+        for extractor in extractors:
+            if file_extension in extractor.file_extensions:
+                logger.debug(f"Selected extractor {extractor.__class__.__name__} for file: {file_path}")
+                return extractor
     logger.error(f"No extractor found for file extension: {file_extension}")
     return None
 
 
+def _extract_one(file_path: str, extractors, fallback=None) -> str:
+    extractor = get_extractor_for_file(file_path, extractors) or fallback
+    if extractor is None:
+        return ""
+    try:
+        return extractor(file_path) or ""
+    except Exception as e:
+        logger.error(f"Extraction failed for {file_path}: {e}")
+        return ""
+
+
+def batch_extract(paths: List[str], extractors, max_workers: int = 16,
+                  use_processes: bool = False, fallback: FileTextExtractor = None) -> List[str]:
+    """
+    Extract text from many files concurrently.
+
+    Threads suit I/O-bound extractors (Tika over HTTP, subprocess-based
+    converters), which spend their time outside the GIL. CPU-bound Python
+    parsing (e.g. PDFs) scales better with `use_processes=True`; the extractors
+    are then pickled to the worker processes, so they must be picklable.
+
+    Parameters
+    ----------
+    paths : list[str]
+        Files to extract.
+    extractors : list or dict
+        Extractor list or extension map, as accepted by get_extractor_for_file.
+    max_workers : int, optional
+        Pool size, by default 16.
+    use_processes : bool, optional
+        Use a ProcessPoolExecutor instead of threads, by default False.
+    fallback : FileTextExtractor, optional
+        Extractor for files no other extractor handles (e.g. Tika).
+
+    Returns
+    -------
+    list[str]
+        Extracted text per path, in input order. Files that have no extractor
+        or fail to extract yield "" (failures are logged) so one bad file does
+        not abort the batch.
+    """
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    extract = functools.partial(_extract_one, extractors=extractors, fallback=fallback)
+    with executor_cls(max_workers=max_workers) as executor:
+        return list(executor.map(extract, paths))
+
+
+# DateExtractor patterns, compiled once at import.
+
+# YYYY[-/.]MM[-/.]DD  (ISO-ish)
+_RX_ISO = r'\b((?:19|20)\d{2})[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12]\d|3[01])\b'
+
+# MM[-/.]DD[-/.]YYYY (US MDY, 4-digit year)
+_RX_MDY4 = r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.]((?:19|20)\d{2})\b'
+
+# MM[-/.]DD[-/.]YY (US MDY, 2-digit year)
+# Examples (match): "6/1/24", "06-01-00", "12.31.69"
+# Non-matches: "1/8" (no 2-digit year), "13/01/24" (invalid month; date() filter will reject anyway)
+_RX_MDY2 = r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.](\d{2})\b'
+
+# (Optional) DD[-/.]MM[-/.]YYYY (DMY)
+_RX_DMY4 = r'\b(0?[1-9]|[12]\d|3[01])[-/.](0?[1-9]|1[0-2])[-/.]((?:19|20)\d{2})\b'
+
+# MonthName DD[, ]YYYY
+_RX_MON = (
+    r'\b'
+    r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
+    r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|'
+    r'nov(?:ember)?|dec(?:ember)?)'
+    r'\s+([0-3]?\d)(?:,)?\s+((?:19|20)\d{2})\b'
+)
+
+# One alternation over the always-on formats so the text is scanned once. It sits in
+# a lookahead so matches of one format don't consume text another format needs
+# (e.g. the year of "Sept 30 2019/12/31"); _scan_dates_re tracks per-format ends to keep
+# findall's non-overlapping semantics. At most one alternative can match at a given
+# position. DMY overlaps MDY and stays a separate, optional pass.
+# With hyperscan installed, _scan_dates_hyperscan replaces this scan.
+_DATE_KINDS = ("iso", "mdy4", "mdy2", "mon")
+_RX_DATES = re.compile(
+    f"(?=(?P<iso>{_RX_ISO})|(?P<mdy4>{_RX_MDY4})|(?P<mdy2>{_RX_MDY2})|(?P<mon>(?i:{_RX_MON})))"
+)
+_RX_DMY4_COMPILED = re.compile(_RX_DMY4)
+
+# every spelling _RX_MON can capture (lowercased) -> month number
+_MONTH_MAP = {
+    alias: i
+    for i, aliases in enumerate(
+        [('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+         ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+         ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december')],
+        start=1,
+    )
+    for alias in aliases
+}
+
+
+def _scan_dates_re(txt: str, enable_dmy: bool) -> dict:
+    """Date matches grouped by format (findall-style tuples), using `re`."""
+    buckets = {kind: [] for kind in _DATE_KINDS}
+    last_end = dict.fromkeys(_DATE_KINDS, 0)
+    for match in _RX_DATES.finditer(txt):
+        kind = match.lastgroup
+        if match.start() < last_end[kind]:
+            continue  # inside an earlier match of the same format
+        last_end[kind] = match.end(kind)
+        # each alternative wraps exactly three capture groups
+        g = _RX_DATES.groupindex[kind]
+        buckets[kind].append(match.group(g + 1, g + 2, g + 3))
+    buckets["dmy4"] = _RX_DMY4_COMPILED.findall(txt) if enable_dmy else []
+    return buckets
+
+
+# Hyperscan can't return capture groups, so it only locates matches; each span is
+# then re-parsed with the matching single-format pattern below.
+_HS_KINDS = _DATE_KINDS + ("dmy4",)
+_RX_BY_KIND = {
+    "iso": re.compile(_RX_ISO),
+    "mdy4": re.compile(_RX_MDY4),
+    "mdy2": re.compile(_RX_MDY2),
+    "mon": re.compile(_RX_MON, re.IGNORECASE),
+    "dmy4": _RX_DMY4_COMPILED,
+}
+
+
+def _build_hyperscan_db():
+    # hyperscan has no \b in Unicode (UCP) mode, so \b, \d and \s are ASCII-only
+    # here; normalized text is ASCII anyway
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_RX_BY_KIND[kind].pattern.encode("utf-8") for kind in _HS_KINDS],
+            ids=list(range(len(_HS_KINDS))),
+            elements=len(_HS_KINDS),
+            flags=[flags | (hyperscan.HS_FLAG_CASELESS if kind == "mon" else 0) for kind in _HS_KINDS],
+        )
+        return db
+    except hyperscan.error as e:
+        logger.warning(f"Could not compile hyperscan date database, using re: {e}")
+        return None
+
+
+_HS_DATE_DB = _build_hyperscan_db() if _HAS_HYPERSCAN else None
+
+
+def _scan_dates_hyperscan(txt: str, enable_dmy: bool) -> dict:
+    """Date matches grouped by format, located with one hyperscan pass over the text."""
+    data = txt.encode("utf-8")
+    spans = {kind: set() for kind in _HS_KINDS}
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans[_HS_KINDS[pattern_id]].add((start, end))
+
+    _HS_DATE_DB.scan(data, match_event_handler=on_match)
+
+    # hyperscan reports every match (overlaps included); keep findall's
+    # leftmost, non-overlapping selection per format
+    buckets = {}
+    for kind in _HS_KINDS:
+        found, last_end = [], 0
+        if kind != "dmy4" or enable_dmy:
+            for start, end in sorted(spans[kind], key=lambda se: (se[0], -se[1])):
+                if start < last_end:
+                    continue
+                match = _RX_BY_KIND[kind].fullmatch(data[start:end].decode("utf-8"))
+                if match:
+                    found.append(match.groups())
+                    last_end = end
+        buckets[kind] = found
+    return buckets
+
+
 class DateExtractor:
     """
     Extract explicit, absolute dates from OCR'ed construction docs.
@@ -247,43 +620,6 @@ class DateExtractor:
         self.enable_dmy = enable_dmy
         self.yy_pivot = yy_pivot  # e.g., 60 -> 60–99 => 1900s; 00–59 => 2000s
 
-        # YYYY[-/.]MM[-/.]DD  (ISO-ish)
-        self.rx_iso = re.compile(
-            r'\b((?:19|20)\d{2})[-/.](0[1-9]|1[0-2])[-/.](0[1-9]|[12]\d|3[01])\b'
-        )
-
-        # MM[-/.]DD[-/.]YYYY (US MDY, 4-digit year)
-        self.rx_mdy4 = re.compile(
-            r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.]((?:19|20)\d{2})\b'
-        )
-
-        # NEW: MM[-/.]DD[-/.]YY (US MDY, 2-digit year)
-        # Examples (match): "6/1/24", "06-01-00", "12.31.69"
-        # Non-matches: "1/8" (no 2-digit year), "13/01/24" (invalid month; date() filter will reject anyway)
-        self.rx_mdy2 = re.compile(
-            r'\b(0?[1-9]|1[0-2])[-/.](0?[1-9]|[12]\d|3[01])[-/.](\d{2})\b'
-        )
-
-        # (Optional) DD[-/.]MM[-/.]YYYY (DMY)
-        self.rx_dmy4 = re.compile(
-            r'\b(0?[1-9]|[12]\d|3[01])[-/.](0?[1-9]|1[0-2])[-/.]((?:19|20)\d{2})\b'
-        )
-
-        # MonthName DD[, ]YYYY
-        self.rx_mon = re.compile(
-            r'(?ix)\b'
-            r'(jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|'
-            r'jul(?:y)?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|'
-            r'nov(?:ember)?|dec(?:ember)?)'
-            r'\s+([0-3]?\d)(?:,)?\s+((?:19|20)\d{2})\b'
-        )
-
-        self.month_to_number_map = {
-            m: i for i, m in enumerate(
-                ['jan','feb','mar','apr','may','jun','jul','aug','sep','oct','nov','dec'], start=1
-            )
-        }
-
     def _normalize_yy(self, yy_str: str) -> int:
         """
         Normalize a 2-digit year to 4 digits using a pivot.
@@ -306,29 +642,39 @@ class DateExtractor:
         if not txt:
             return []
 
+        # bucket matches by format so candidates keep the per-format order
+        # (all ISO dates, then MDY4, MDY2, DMY, month names)
+        if _HS_DATE_DB is not None:
+            try:
+                buckets = _scan_dates_hyperscan(txt, self.enable_dmy)
+            except UnicodeEncodeError:
+                # lone surrogates can't be handed to hyperscan as UTF-8
+                buckets = _scan_dates_re(txt, self.enable_dmy)
+        else:
+            buckets = _scan_dates_re(txt, self.enable_dmy)
+
         candidates = []
 
         # ISO YYYY-MM-DD
-        for y, m, d in self.rx_iso.findall(txt):
+        for y, m, d in buckets["iso"]:
             candidates.append((int(y), int(m), int(d)))
 
         # MDY with 4-digit year
-        for m, d, y in self.rx_mdy4.findall(txt):
+        for m, d, y in buckets["mdy4"]:
             candidates.append((int(y), int(m), int(d)))
 
         # MDY with 2-digit year (normalize via pivot)
-        for m, d, yy in self.rx_mdy2.findall(txt):
+        for m, d, yy in buckets["mdy2"]:
             y_full = self._normalize_yy(yy)  # ensures 00 -> 2000, 69 -> 1969, etc.
             candidates.append((int(y_full), int(m), int(d)))
 
-        # DMY (optional)
-        if self.enable_dmy:
-            for d, m, y in self.rx_dmy4.findall(txt):
-                candidates.append((int(y), int(m), int(d)))
+        # DMY (optional; empty unless enable_dmy)
+        for d, m, y in buckets["dmy4"]:
+            candidates.append((int(y), int(m), int(d)))
 
         # MonthName DD, YYYY
-        for mon, d, y in self.rx_mon.findall(txt):
-            candidates.append((int(y), self.month_to_number_map[mon[:3].lower()], int(d)))
+        for mon, d, y in buckets["mon"]:
+            candidates.append((int(y), _MONTH_MAP[mon.lower()], int(d)))
 
         # Validate + year window filter
         out = []
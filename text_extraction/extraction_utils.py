@@ -1,15 +1,23 @@
 # text_extraction/extraction_utils.py
 
 # --- imports ---
+import functools
+import hashlib
 import logging
+import os
 import pythoncom
+import sqlite3
 import subprocess
+import sys
 import tempfile
+import threading
 import unicodedata
 import win32com.client
 from bs4 import BeautifulSoup
 from contextlib import contextmanager
+from lxml import etree
 from pathlib import Path
+from selectolax.lexbor import LexborHTMLParser
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +28,21 @@ except ImportError:
     _HAS_UNIDECODE = False
 
 # common replacements (curly quotes, dashes, ligatures, etc.)
+# built once; str.translate applies all of them in a single pass
+_COMMON_CHAR_TABLE = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u00a0": " ",  # non-breaking space
+    "\u2026": "...",  # ellipsis
+    "\ufb01": "fi",  # ﬁ ligature
+    "\ufb02": "fl",  # ﬂ ligature
+    "\x00": None,  # remove NUL bytes
+})
+
 def common_char_replacements(text: str) -> str:
     """
     Replace common typographic Unicode characters with simpler ASCII equivalents.
@@ -34,23 +57,17 @@ def common_char_replacements(text: str) -> str:
     str
         Text with characters like “ ” – — ﬁ ﬂ replaced by their ASCII counterparts.
     """
+    # isascii() is a flag check and `in` is a memchr; pure-ASCII text without NULs
+    # has nothing to replace, so skip the copy translate would make
+    if text.isascii() and "\x00" not in text:
+        return text
+    return text.translate(_COMMON_CHAR_TABLE)
 
-    replacements_dict = {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u2013": "-",  # en dash
-        "\u2014": "-",  # em dash
-        "\u00a0": " ",  # non-breaking space
-        "\u2026": "...",  # ellipsis
-        "\ufb01": "fi",  # ﬁ ligature
-        "\ufb02": "fl",  # ﬂ ligature
-        "\x00": "",  # remove NUL bytes
-    }
-    for src, dst in replacements_dict.items():
-        text = text.replace(src, dst)   
-    return text
+# every combining mark (categories Mn, Mc, Me) mapped to None, so strip_diacritics can
+# drop them with one str.translate instead of a per-character Python loop
+_COMBINING_MARKS_TABLE = dict.fromkeys(
+    c for c in range(sys.maxunicode + 1) if unicodedata.category(chr(c)).startswith("M")
+)
 
 def strip_diacritics(text: str) -> str:
     """
@@ -71,7 +88,7 @@ def strip_diacritics(text: str) -> str:
     # Normalize to NFD to separate base chars from diacritics
     nfkd = unicodedata.normalize("NFD", text)
     # Remove combining marks (diacritics)
-    no_diacritics = "".join(c for c in nfkd if not unicodedata.category(c).startswith("M"))
+    no_diacritics = nfkd.translate(_COMBINING_MARKS_TABLE)
     # Recompose
     cleaned = unicodedata.normalize("NFC", no_diacritics)
     if _HAS_UNIDECODE:
@@ -106,6 +123,79 @@ def validate_file(path: str) -> Path:
         raise FileNotFoundError(path)
     return p
 
+# default location of the shared extracted-text cache
+EXTRACT_CACHE_DIR = Path.home() / ".cache" / "vec_search_demo" / "extract"
+
+def extraction_cache_key(p: Path, config: str) -> bytes:
+    """
+    Build the text-cache key for a file as extracted with a given configuration.
+
+    The key covers the resolved path, modification time and size, so editing
+    or replacing the file invalidates its entry without any explicit eviction.
+
+    Parameters
+    ----------
+    p : Path
+        File being extracted.
+    config : str
+        Summary of the extractor class and the options that affect its output.
+
+    Returns
+    -------
+    bytes
+        16-byte BLAKE2b digest.
+    """
+    st = p.stat()
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{p.resolve()}|{st.st_mtime_ns}|{st.st_size}|{config}".encode("utf-8"))
+    return h.digest()
+
+class TextCache:
+    """
+    SQLite-backed store of extracted text, shared by all extractor instances.
+
+    Parameters
+    ----------
+    path : str or Path
+        Location of the SQLite database file (parent directories are created).
+    """
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # extractors run in worker threads, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS texts (key BLOB PRIMARY KEY, text TEXT)")
+        self._conn.commit()
+
+    def get(self, key: bytes) -> str | None:
+        """Return the cached text for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM texts WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: bytes, text: str) -> None:
+        """Store text under key."""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO texts (key, text) VALUES (?, ?)", (key, text))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+@functools.cache
+def get_text_cache() -> TextCache:
+    """
+    Return the process-wide extracted-text cache.
+
+    Its directory defaults to EXTRACT_CACHE_DIR and can be moved with the
+    EXTRACT_CACHE_DIR environment variable.
+    """
+    cache_dir = Path(os.getenv("EXTRACT_CACHE_DIR", EXTRACT_CACHE_DIR))
+    return TextCache(cache_dir / "text.sqlite3")
+
 def normalize_whitespace(text: str) -> str:
     """
     Collapse all whitespace (spaces, newlines, tabs) into single spaces.
@@ -136,9 +226,36 @@ def normalize_unicode(text: str) -> str:
     str
         NFC-normalized text.
     """
+    # quick check (UAX #15) is a single scan with no allocation; most extracted
+    # text is already NFC, so only build a new string when it isn't
+    if unicodedata.is_normalized("NFC", text):
+        return text
     return unicodedata.normalize("NFC", text)
 
-def strip_html(html: str, parser: str = "lxml", remove_tags=None) -> str:
+def normalize_text(text: str) -> str:
+    """
+    Apply the full cleanup pipeline used before embedding.
+
+    Runs common_char_replacements, strip_diacritics, normalize_unicode and
+    normalize_whitespace in order, rebinding one variable so each intermediate
+    copy can be freed as soon as the next pass finishes.
+
+    Parameters
+    ----------
+    text : str
+        Raw extracted text.
+
+    Returns
+    -------
+    str
+        ASCII-folded, NFC-normalized text with collapsed whitespace.
+    """
+    text = common_char_replacements(text)
+    text = strip_diacritics(text)
+    text = normalize_unicode(text)
+    return normalize_whitespace(text)
+
+def strip_html(html: str, parser: str = "selectolax", remove_tags=None) -> str:
     """
     Strip HTML tags and collapse resulting text.
 
@@ -147,7 +264,9 @@ def strip_html(html: str, parser: str = "lxml", remove_tags=None) -> str:
     html : str
         Raw HTML content.
     parser : str, optional
-        Parser to pass to BeautifulSoup, by default "lxml".
+        "selectolax" (default) parses with selectolax's lexbor engine, a C parser
+        with no Python-level tree. Any other value (e.g. "lxml", "html.parser")
+        is passed to BeautifulSoup.
     remove_tags : list[str] or None
         Tags to remove entirely (e.g., ["script", "style"]), by default None.
 
@@ -158,11 +277,80 @@ def strip_html(html: str, parser: str = "lxml", remove_tags=None) -> str:
     """
     if remove_tags is None:
         remove_tags = ["script", "style", "noscript"]
+    if parser == "selectolax":
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(remove_tags)
+        # root rather than body so <head><title> text is kept, as get_text() does
+        return normalize_whitespace(tree.root.text(separator=" ", strip=True) if tree.root else "")
     soup = BeautifulSoup(html, parser)
     for t in soup(remove_tags):
         t.decompose()
     return normalize_whitespace(soup.get_text(separator=" ", strip=True))
 
+def strip_xml(source) -> str:
+    """
+    Extract the character data of an XML document without building its full tree.
+
+    The document is parsed incrementally with lxml's iterparse; each top-level
+    element is turned into text once it is complete and then discarded, so
+    memory stays bounded by the largest top-level element.
+
+    Parameters
+    ----------
+    source : str, Path or file-like
+        XML file path or binary file object. The parser honours the document's
+        own encoding declaration.
+
+    Returns
+    -------
+    str
+        Text content in document order (comments and processing instructions
+        excluded), with whitespace normalized.
+    """
+    parts = []
+
+    def add(text):
+        if text and (text := text.strip()):
+            parts.append(text)
+
+    root, prev, depth = None, None, 0
+    context = etree.iterparse(
+        str(source) if isinstance(source, Path) else source,
+        events=("start", "end"),
+        remove_comments=True,
+        remove_pis=True,
+        recover=True,
+        huge_tree=True,
+    )
+    for event, elem in context:
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 1:
+            # a top-level child is complete. Its own tail may not be parsed yet,
+            # so emit the previous sibling's tail (or the root's leading text)
+            # first, then drop that sibling.
+            if prev is None:
+                add(root.text)
+            else:
+                add(prev.tail)
+                root.remove(prev)
+            for text in elem.itertext():
+                add(text)
+            prev = elem
+        elif depth == 0:
+            if prev is None:
+                for text in root.itertext():
+                    add(text)
+            else:
+                add(prev.tail)
+
+    return normalize_whitespace(" ".join(parts))
+
 def run_pandoc(src: str, pandoc_path: str, to_format: str = "plain") -> Path:
     """
     Convert a document using Pandoc and return the path to the output file.
@@ -191,6 +379,35 @@ def run_pandoc(src: str, pandoc_path: str, to_format: str = "plain") -> Path:
     subprocess.run(cmd, check=True)
     return out
 
+def pandoc_to_text(src: str, pandoc_path: str, to_format: str = "plain") -> str:
+    """
+    Convert a document using Pandoc and return the output as a string.
+
+    Like run_pandoc, but reads pandoc's stdout instead of writing (and then
+    re-reading) a temp file.
+
+    Parameters
+    ----------
+    src : str
+        Source document path.
+    pandoc_path : str
+        Full path to the pandoc executable.
+    to_format : str, optional
+        Output format for pandoc (default is "plain").
+
+    Returns
+    -------
+    str
+        The converted document.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If pandoc fails.
+    """
+    result = subprocess.run([pandoc_path, src, "-t", to_format], check=True, capture_output=True)
+    return result.stdout.decode("utf-8", errors="ignore")
+
 @contextmanager
 def com_app(dispatch_name: str, visible: bool = False):
     """
@@ -1,7 +1,10 @@
 # text_extraction/image_extractor.py
 import logging
+import os
 import pytesseract
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from pathlib import Path
 from PIL import Image, ImageOps, ImageSequence
@@ -15,8 +18,32 @@ try:
 except ImportError:
     _HAS_CV2 = False
 
+try:
+    import tesserocr  # optional in-process Tesseract API (no subprocess per call)
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
+
 from .basic_extraction import FileTextExtractor
 
+# counter-clockwise quarter turns as lossless transposes (what rotate(..., expand=True) does)
+_TRANSPOSE_CCW = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Pillow fallback binarization: pixels brighter than 200 become white
+_THRESHOLD_LUT = [255 if x > 200 else 0 for x in range(256)]
+
+# Tesseract calls in flight across every extractor and thread in the process.
+# Callers already run extractions concurrently (app.py's extract limiter, batch
+# thread pools); without a shared cap their frame pools would multiply.
+_OCR_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 1)
+
+# default frame pool size; the shared semaphore above bounds the total anyway
+_DEFAULT_FRAME_WORKERS = 2
+
 
 class ImageTextExtractor(FileTextExtractor):
     """
@@ -24,6 +51,10 @@ class ImageTextExtractor(FileTextExtractor):
 
     Supports automatic orientation correction via Tesseract OSD,
     plus optional light pre-processing for better OCR on scans/phone pics.
+
+    When tesserocr is installed, OSD and OCR run through its in-process
+    Tesseract API, kept alive per thread, instead of launching tesseract (and
+    reloading the language model) for every frame.
     
     Supports: PNG, JPG/JPEG, TIFF, BMP, GIF (first frame), HEIC (if pillow-heif installed).
     """
@@ -36,7 +67,9 @@ class ImageTextExtractor(FileTextExtractor):
                  oem: int = 3,
                  preprocess: bool = True,
                  max_side: int = 3000,
-                 default_image_dpi: int = 300):
+                 default_image_dpi: int = 300,
+                 detect_orientation: bool = True,
+                 max_workers: int | None = None):
         r"""
         Parameters
         ----------
@@ -54,6 +87,13 @@ class ImageTextExtractor(FileTextExtractor):
             Resize largest image side to this (keeps memory reasonable).
         default_image_dpi : int
             DPI to use for images without embedded DPI info.
+        detect_orientation : bool
+            Run Tesseract OSD on each frame and rotate it upright. Disable for
+            sources known to be upright to skip the OSD pass entirely.
+        max_workers : int | None
+            Threads used to OCR the frames of multi-page images (default: 2).
+            Tesseract calls across all extractors in the process are further
+            capped at the CPU count.
         """
         super().__init__()
         if tesseract_cmd:
@@ -64,6 +104,12 @@ class ImageTextExtractor(FileTextExtractor):
         self.preprocess = preprocess
         self.max_side = max_side
         self.default_image_dpi = default_image_dpi
+        self.detect_orientation = detect_orientation
+        # tesserocr API handles are not thread-safe; each thread gets its own
+        self._local = threading.local()
+        self.max_workers = max_workers or min(_DEFAULT_FRAME_WORKERS, os.cpu_count() or 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     def __call__(self, path: str) -> str:
         logger.info(f"Extracting text from image: {path}")
@@ -73,46 +119,60 @@ class ImageTextExtractor(FileTextExtractor):
 
         images = self._load_images(p)
         logger.debug(f"Loaded {len(images)} image frames for OCR")
-        texts = []
-        for img in images:
-            # detect and correct orientation
-            img = self._ensure_longside_bottom(img)
-            img = self._inject_dpi(img, self.default_image_dpi)
-            img = self.detect_and_correct_orientation(img)
-            if self.preprocess:
-                img = self._preprocess(img)
-                logger.debug("Applied preprocessing to image")
-
-            cfg = f"--psm {self.psm} --oem {self.oem}"
-            txt = pytesseract.image_to_string(
-                image=img,
-                lang=self.lang,
-                config=config_str(cfg)
-                )
-            logger.debug(f"Extracted text length: {len(txt)} characters")
-            texts.append(txt)
+        if len(images) == 1:
+            texts = [self._ocr_frame(images[0])]
+        else:
+            # Tesseract releases the GIL while it works, so frames OCR in parallel
+            texts = list(self._frame_executor().map(self._ocr_frame, images))
 
         return "\n".join(texts)
 
+    def _ocr_frame(self, img: Image.Image) -> str:
+        with _OCR_SLOTS:
+            txt = self._ocr(self._prep(img))
+        logger.debug(f"Extracted text length: {len(txt)} characters")
+        return txt
+
+    def _frame_executor(self) -> ThreadPoolExecutor:
+        # created once and kept, so worker threads (and their tesserocr APIs, with
+        # the language model loaded) are reused across files
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ocr")
+            return self._executor
+
     # ---------- helpers ----------
     def _load_images(self, path: Path) -> List[Image.Image]:
         """Handle multi-page TIFFs and GIFs gracefully."""
         logger.debug(f"Loading images from path: {path}")
-        imgs = []
+        # preprocessing binarizes a grayscale copy anyway, so load straight to 'L'
+        # (a third of the RGB working set); otherwise keep RGB for OCR
+        mode = "L" if self.preprocess else "RGB"
         with Image.open(path) as im:
-            try:
-                for frame in ImageSequence.Iterator(im):
-                    imgs.append(frame.convert("RGB"))
-            except Exception:
-                # Not multi-frame
-                imgs.append(im.convert("RGB"))
+            if getattr(im, "n_frames", 1) == 1:
+                # single frame (JPEG, PNG, ...): no sequence iteration, and no
+                # copy when the file is already in the target mode
+                im.load()
+                imgs = [im if im.mode == mode else im.convert(mode)]
+            else:
+                # the iterator reuses one object per frame, so always take a copy
+                imgs = [frame.convert(mode) if frame.mode != mode else frame.copy()
+                        for frame in ImageSequence.Iterator(im)]
         # Resize if gigantic
         out = []
         for img in imgs:
-            if max(img.size) > self.max_side:
-                scale = self.max_side / max(img.size)
+            scale = self.max_side / max(img.size)
+            # within 10% of the limit the resize costs more than it saves
+            if scale < 0.9:
                 new_sz = (int(img.width * scale), int(img.height * scale))
-                img = img.resize(new_sz, Image.LANCZOS)
+                if _HAS_CV2:
+                    # area averaging is the right filter for downscaling and much
+                    # cheaper than Lanczos
+                    resized = Image.fromarray(cv2.resize(np.asarray(img), new_sz, interpolation=cv2.INTER_AREA))
+                    resized.info = img.info.copy()
+                    img = resized
+                else:
+                    img = img.resize(new_sz, Image.LANCZOS)
                 logger.debug(f"Resized image to: {new_sz}")
             out.append(img)
         return out
@@ -125,7 +185,9 @@ class ImageTextExtractor(FileTextExtractor):
         """
         logger.debug("Starting preprocessing of image, _HAS_CV2=%s", _HAS_CV2)
         if _HAS_CV2:
-            img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2GRAY)
+            img = np.asarray(pil_img)
+            if img.ndim == 3:
+                img = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
             # adaptive threshold helps on uneven lighting
             img = cv2.adaptiveThreshold(img, 255,
                                         cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
@@ -133,15 +195,46 @@ class ImageTextExtractor(FileTextExtractor):
             return Image.fromarray(img)
         else:
             # Pillow-only fallback
-            img = ImageOps.grayscale(pil_img)
-            # Simple point threshold
-            img = img.point(lambda x: 255 if x > 200 else 0)
+            img = pil_img if pil_img.mode == "L" else ImageOps.grayscale(pil_img)
+            # Simple point threshold (256-entry lookup table, applied in C)
+            img = img.point(_THRESHOLD_LUT)
             return img
 
-    def _ensure_longside_bottom(self, pil_img: Image.Image) -> Image.Image:
+    def _prep(self, pil_img: Image.Image) -> Image.Image:
         """
-        Rotate image to landscape if its short/long ratio deviates from
-        8.5×11 (≈0.773), so the long side ends up on the bottom.
+        Make one frame OCR-ready: DPI, orientation and preprocessing, with a
+        single rotation.
+
+        The long-side-bottom rule only pre-rotates for OSD, and OSD corrects
+        whatever orientation it is given, so when OSD succeeds its answer for
+        the unrotated frame is the whole correction. The rotation is applied
+        last, as a lossless transpose of the (already single-channel, when
+        preprocessing) frame.
+        """
+        pil_img = self._inject_dpi(pil_img, self.default_image_dpi)
+
+        osd_angle = self._osd_rotation(pil_img) if self.detect_orientation else None
+        if osd_angle is not None:
+            ccw = (360 - osd_angle) % 360
+        else:
+            ccw = self._longside_rotation(pil_img)
+
+        if self.preprocess:
+            info = pil_img.info
+            pil_img = self._preprocess(pil_img)
+            pil_img.info = info  # keep the DPI for OCR
+            logger.debug("Applied preprocessing to image")
+
+        if ccw:
+            pil_img = pil_img.transpose(_TRANSPOSE_CCW[ccw])
+            logger.info(f"Rotated image by {ccw} degrees to correct orientation")
+        return pil_img
+
+    @staticmethod
+    def _longside_rotation(pil_img: Image.Image) -> int:
+        """
+        Counter-clockwise rotation (0 or 90) that puts the long side on the
+        bottom when the short/long ratio deviates from 8.5×11 (≈0.773).
         """
         w, h = pil_img.size
         short_side, long_side = sorted((w, h))
@@ -150,27 +243,65 @@ class ImageTextExtractor(FileTextExtractor):
         # if it’s not roughly letter‐sized and is portrait, rotate to landscape
         if abs(ratio - letter_ratio) > 0.05 and h > w:
             logger.debug(f"Rotating image from portrait to landscape: {w}x{h}")
-            return pil_img.rotate(90, expand=True)
-        return pil_img
+            return 90
+        return 0
 
     def detect_and_correct_orientation(self, pil_img: Image.Image) -> Image.Image:
         """
         Use Tesseract OSD to detect rotation and counter-rotate image upright.
         """
+        angle = self._osd_rotation(pil_img)
+        if angle:
+            pil_img = pil_img.transpose(_TRANSPOSE_CCW[360 - angle])
+            logger.info(f"Rotated image by {360-angle} degrees to correct orientation")
+        return pil_img
+
+    def _ocr(self, pil_img: Image.Image) -> str:
+        """OCR one prepared frame."""
+        if _HAS_TESSEROCR:
+            api = getattr(self._local, "ocr_api", None)
+            if api is None:
+                api = self._local.ocr_api = tesserocr.PyTessBaseAPI(lang=self.lang, psm=self.psm, oem=self.oem)
+            api.SetImage(pil_img)
+            # pytesseract passes DPI through the image file; tell the API directly
+            api.SetSourceResolution(int(pil_img.info.get("dpi", (self.default_image_dpi,))[0]))
+            return api.GetUTF8Text()
+
+        cfg = f"--psm {self.psm} --oem {self.oem}"
+        return pytesseract.image_to_string(
+            image=pil_img,
+            lang=self.lang,
+            config=config_str(cfg)
+            )
+
+    def _osd_rotation(self, pil_img: Image.Image) -> int | None:
+        """
+        Clockwise rotation (0/90/180/270) Tesseract OSD says the image needs, or
+        None if OSD fails.
+        """
+        if _HAS_TESSEROCR:
+            api = getattr(self._local, "osd_api", None)
+            if api is None:
+                # the OSD model stays loaded for this thread's later frames
+                api = self._local.osd_api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.OSD_ONLY)
+            api.SetImage(pil_img)
+            osd = api.DetectOrientationScript()
+            if not osd:
+                logger.error("Tesseract OSD failed")
+                return None
+            logger.debug(f"Tesseract OSD output: {osd}")
+            # orient_deg is the page's current orientation; OSD's "Rotate" is its complement
+            return (360 - osd["orient_deg"]) % 360
+
         try:
             osd = pytesseract.image_to_osd(pil_img)
         except pytesseract.TesseractError as e:
             logger.error(f"Tesseract OSD failed: {e}")
-            return pil_img
+            return None
 
         logger.debug(f"Tesseract OSD output: {osd.strip()}")
         rot_match = re.search(r"Rotate: (\d+)", osd)
-        if rot_match:
-            angle = int(rot_match.group(1))
-            if angle != 0:
-                pil_img = pil_img.rotate(360 - angle, expand=True)
-                logger.info(f"Rotated image by {360-angle} degrees to correct orientation")
-        return pil_img
+        return int(rot_match.group(1)) % 360 if rot_match else None
     
     def _inject_dpi(self, pil_img: Image.Image, dpi: int) -> Image.Image:
         """
@@ -1,37 +1,447 @@
 # text_extraction/msft_extractor.py
 
+import asyncio
+import atexit
+import functools
+import importlib
 import io
+import itertools
 import logging
+import os
+import posixpath
 import mammoth
+import openpyxl
+import re
+import shutil
+import subprocess
 import tempfile
+import threading
+import zipfile
 import pandas as pd
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List
-from docx import Document
+from lxml import etree
+from openpyxl.reader.strings import read_string_table
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+from openpyxl.xml.functions import fromstring as openpyxl_fromstring
 from striprtf.striprtf import rtf_to_text
 
 from .basic_extraction import FileTextExtractor
-from .extraction_utils import validate_file, run_pandoc, com_app
+from .extraction_utils import validate_file, run_pandoc, pandoc_to_text, com_app, extraction_cache_key, get_text_cache
 
 logger = logging.getLogger(__name__)
 
-class WordFileTextExtractor(FileTextExtractor):
+try:
+    from unoserver.client import UnoClient  # long-lived LibreOffice for conversions
+    _HAS_UNOSERVER = True
+except ImportError:
+    _HAS_UNOSERVER = False
+
+# WordprocessingML tags read by the docx fallback
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_P, _W_T, _W_TAB, _W_BR = (_W_NS + t for t in ("p", "t", "tab", "br"))
+
+# PresentationML/DrawingML tags read by the pptx fast path
+_P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_P_SHAPE_TAGS = frozenset(_P_NS + t for t in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart"))
+
+# SpreadsheetML tags read by the xlsx fast path
+_X_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+# RTF at least this large goes to unrtf (C) when it is on PATH
+RTF_UNRTF_MIN_BYTES = 1024 * 1024
+
+# groups holding hex-encoded images/OLE data; striprtf would walk them a
+# character at a time only to discard them
+_RTF_BINARY_GROUP = re.compile(
+    r"\{\\(?:\*\\)?(?:pict|shppict|nonshppict|objdata|datastore|themedata|colorschememapping)\b"
+)
+_RTF_BRACE = re.compile(r"[{}]")
+
+# mammoth already parses its default style map once at import; what it repeats
+# per file is opening the zip again to look for a style map embedded by
+# mammoth.embed_style_map, which ordinary Word files never carry
+_MAMMOTH_OPTIONS = {"include_embedded_style_map": False}
+
+# with parallel_sheets on, workbooks at least this large extract multiple sheets
+# in parallel processes
+PARALLEL_SHEETS_MIN_BYTES = 8 * 1024 * 1024
+
+# Office COM objects live in a single-threaded apartment, so async callers run
+# every COM-backed extraction on this one thread
+_COM_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="office-com")
+
+# XML-RPC port of the unoserver process started by _soffice_client
+SOFFICE_SERVER_PORT = 2003
+
+_soffice_server: subprocess.Popen | None = None
+_soffice_lock = threading.Lock()
+
+def _soffice_client(soffice_path: str | None) -> "UnoClient":
+    """
+    Return a client for this process's unoserver, starting it on first use.
+
+    One headless LibreOffice stays up for every conversion instead of each
+    file paying its 1-3 s start-up. The server is restarted if it has exited
+    and stopped by shutdown_soffice_server at interpreter exit.
+    """
+    global _soffice_server
+    with _soffice_lock:
+        if _soffice_server is None or _soffice_server.poll() is not None:
+            cmd = [shutil.which("unoserver") or "unoserver",
+                   "--interface", "127.0.0.1", "--port", str(SOFFICE_SERVER_PORT)]
+            if soffice_path:
+                cmd += ["--executable", soffice_path]
+            logger.info(f"Starting LibreOffice server: {' '.join(cmd)}")
+            _soffice_server = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # the client retries its connection while the server is still starting
+    return UnoClient(port=str(SOFFICE_SERVER_PORT))
+
+def shutdown_soffice_server() -> None:
+    """Stop the LibreOffice server started by _soffice_client, if any."""
+    global _soffice_server
+    with _soffice_lock:
+        proc, _soffice_server = _soffice_server, None
+    if proc is None or proc.poll() is not None:
+        return
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+atexit.register(shutdown_soffice_server)
+
+@contextmanager
+def _shared_com_app(owner, attr: str, dispatch_name: str, needed: bool):
+    """
+    Start one COM application and expose it as `owner.<attr>` for the block.
+
+    Used by the extract_many batch APIs so every file in the batch reuses the
+    same Word/PowerPoint process instead of starting one per file. Yields
+    without starting anything when `needed` is False.
+    """
+    if not needed:
+        yield None
+        return
+    with com_app(dispatch_name, visible=False) as app:
+        setattr(owner, attr, app)
+        try:
+            yield app
+        finally:
+            setattr(owner, attr, None)
+
+def _extract_each(extractor, paths: List[str]) -> List[str]:
+    """Run extractor over paths in order, logging failures as empty strings."""
+    texts = []
+    for path in paths:
+        try:
+            texts.append(extractor(path))
+        except Exception as e:
+            logger.error(f"Failed to extract text from {path}: {e}")
+            texts.append("")
+    return texts
+
+def _strip_rtf_binary_groups(rtf: str) -> str:
+    """Remove \\pict/\\objdata-style groups (and everything nested in them) from RTF source."""
+    if "\\bin" in rtf:
+        # raw \bin payloads may contain unbalanced braces; leave those to striprtf
+        return rtf
+    parts = []
+    pos = 0
+    while (m := _RTF_BINARY_GROUP.search(rtf, pos)) is not None:
+        parts.append(rtf[pos:m.start()])
+        depth = 1
+        pos = len(rtf)
+        for brace in _RTF_BRACE.finditer(rtf, m.end()):
+            depth += 1 if brace.group() == "{" else -1
+            if depth == 0:
+                pos = brace.end()
+                break
+    parts.append(rtf[pos:])
+    return "".join(parts)
+
+def _strip_unrtf_header(text: str) -> str:
+    # unrtf --text starts with "###" comment lines and a dashed separator
+    lines = text.split("\n")
+    i = 0
+    while i < len(lines) and lines[i].startswith("###"):
+        i += 1
+    if i < len(lines) and lines[i].startswith("-----"):
+        i += 1
+    return "\n".join(lines[i:])
+
+# per-process extractor used by extract_batch workers
+_batch_extractor = None
+
+def _init_batch_worker(cls, config: dict) -> None:
+    global _batch_extractor
+    _batch_extractor = cls(**config)
+    # the batch pool already has a process per core; no nested sheet pools
+    if hasattr(_batch_extractor, "parallel_sheets"):
+        _batch_extractor.parallel_sheets = False
+
+def _batch_worker_extract(path: str) -> str:
+    return _extract_each(_batch_extractor, [path])[0]
+
+def _zip_rels(z: zipfile.ZipFile, part: str) -> dict:
+    """Map relationship id -> (type, absolute part name) for an OPC package part."""
+    folder, name = posixpath.split(part)
+    try:
+        root = etree.fromstring(z.read(posixpath.join(folder, "_rels", name + ".rels")))
+    except KeyError:
+        return {}
+    # targets are relative to the part's folder, or to the package root when they start with "/"
+    return {
+        rel.get("Id"): (rel.get("Type"), posixpath.normpath(posixpath.join(folder, rel.get("Target"))).lstrip("/"))
+        for rel in root.iter(_PKG_REL)
+        if rel.get("TargetMode") != "External"
+    }
+
+def _dml_paragraphs(tx_body) -> List[str]:
+    # same as python-pptx's paragraph.text: run/field text, line breaks as "\v"
+    return [
+        "".join("\v" if el.tag == _A_NS + "br" else (el.text or "")
+                for el in para.iter(_A_NS + "t", _A_NS + "br"))
+        for para in tx_body.iterchildren(_A_NS + "p")
+    ]
+
+def _placeholder(shape_el):
+    return shape_el.find(f"./*/{_P_NS}nvPr/{_P_NS}ph")
+
+def _sp_tree_texts(tree, out: List[str]) -> None:
+    """Append the text of each shape under tree, as _shape_text would produce it."""
+    for el in tree.iterchildren(_P_NS + "sp", _P_NS + "graphicFrame", _P_NS + "grpSp"):
+        if el.tag == _P_NS + "sp":
+            tx_body = el.find(_P_NS + "txBody")
+            if tx_body is not None:
+                txt = "\n".join(t for t in _dml_paragraphs(tx_body) if t and not t.isspace())
+                if txt:
+                    out.append(txt)
+        elif el.tag == _P_NS + "graphicFrame":
+            tbl = el.find(f".//{_A_NS}tbl")
+            if tbl is None:
+                continue
+            rows = []
+            for tr in tbl.iterchildren(_A_NS + "tr"):
+                cells = []
+                for tc in tr.iterchildren(_A_NS + "tc"):
+                    tx_body = tc.find(_A_NS + "txBody")
+                    cells.append("" if tx_body is None else "\n".join(_dml_paragraphs(tx_body)).strip())
+                if any(cells):
+                    rows.append("\t".join(cells))
+            if rows:
+                out.append("\n".join(rows))
+        else:
+            _sp_tree_texts(el, out)
+
+def _xlsx_package(z: zipfile.ZipFile):
+    """
+    Locate the parts of an xlsx package that the fast path reads.
+
+    Returns
+    -------
+    tuple
+        (worksheet name -> part name in workbook order, chartsheets excluded;
+        shared strings part or None; styles part or None; date epoch)
+    """
+    wb = etree.fromstring(z.read("xl/workbook.xml"))
+    rels = _zip_rels(z, "xl/workbook.xml")
+    sheets = {}
+    for sh in wb.iterfind(f"{_X_NS}sheets/{_X_NS}sheet"):
+        rel_type, part = rels[sh.get(_R_ID)]
+        if rel_type.endswith("/worksheet"):
+            sheets[sh.get("name")] = part
+    by_type = {rel_type.rsplit("/", 1)[-1]: part for rel_type, part in rels.values()}
+    pr = wb.find(_X_NS + "workbookPr")
+    date1904 = pr is not None and pr.get("date1904", "").lower() in ("1", "true")
+    epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+    return sheets, by_type.get("sharedStrings"), by_type.get("styles"), epoch
+
+def _xlsx_rows(f, strings, date_styles, timedelta_styles, epoch, max_row=None, max_col=None):
+    """
+    Yield the cached cell values of a worksheet XML stream, row by row.
+
+    Mirrors openpyxl's read-only `iter_rows(values_only=True)` for data_only
+    workbooks: values sit at their column positions, missing rows come out
+    empty, numbers in date-formatted cells become datetimes. Formulas (<f>)
+    are never looked at.
+    """
+    c_tag, v_tag = _X_NS + "c", _X_NS + "v"
+    inline_t = (f"{_X_NS}is/{_X_NS}t", f"{_X_NS}is/{_X_NS}r/{_X_NS}t")
+    expected = 1
+    for _, row in etree.iterparse(f, events=("end",), tag=_X_NS + "row"):
+        r = row.get("r")
+        rnum = int(r) if r else expected
+        if max_row and rnum > max_row:
+            break
+        while expected < rnum:
+            yield ()
+            expected += 1
+
+        values = []
+        col = 0
+        for c in row.iterchildren(c_tag):
+            ref = c.get("r")
+            col = column_index_from_string(ref.rstrip("0123456789")) if ref else col + 1
+            if max_col and col > max_col:
+                break
+            t = c.get("t", "n")
+            if t == "inlineStr":
+                # same as openpyxl's Text.content: plain <t> then the rich-text runs
+                value = "".join(el.text or "" for path in inline_t for el in c.iterfind(path))
+            else:
+                value = c.findtext(v_tag) or None
+                if value is None:
+                    continue
+                if t == "n":
+                    value = float(value) if "." in value or "E" in value or "e" in value else int(value)
+                    style = int(c.get("s", 0))
+                    if style in date_styles:
+                        try:
+                            value = from_excel(value, epoch, timedelta=style in timedelta_styles)
+                        except (OverflowError, ValueError):
+                            value = "#VALUE!"
+                elif t == "s":
+                    value = strings[int(value)]
+                elif t == "b":
+                    value = bool(int(value))
+                elif t == "d":
+                    value = from_ISO8601(value)
+            if value is None:
+                continue
+            if len(values) < col:
+                values.extend([None] * (col - len(values)))
+            values[col - 1] = value
+        yield tuple(values)
+        expected = rnum + 1
+
+        # drop finished rows so the tree stays small
+        row.clear()
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+
+class _CachedExtractor(ABC):
+    """
+    Mixin that memoizes extracted text in the shared on-disk text cache.
+
+    Subclasses implement `_extract(path)` in place of `__call__` and
+    `_config_key()` summarizing the init options that change their output.
+    Entries are keyed by path, mtime and size (see extraction_cache_key), so
+    files that are re-visited unchanged are only parsed once. Caching is off
+    by default: it only pays for batch/CLI runs over a stable tree, and in a
+    request handler it would keep user documents on disk under throwaway
+    temp paths that never hit again.
+
+    aextract sends files for which `_needs_com(path)` is true to the single
+    COM thread instead of the shared worker-thread pool.
+    """
+    use_cache: bool = False
+
+    def __call__(self, path: str) -> str:
+        if not self.use_cache:
+            return self._extract(path)
+        p = validate_file(path)
+        key = extraction_cache_key(p, f"{type(self).__name__}|{self._config_key()}")
+        cache = get_text_cache()
+        text = cache.get(key)
+        if text is not None:
+            logger.debug(f"Extracted-text cache hit: {p}")
+            return text
+        text = self._extract(path)
+        cache.set(key, text)
+        return text
+
+    @classmethod
+    def extract_batch(cls, paths: List[str], workers: int | None = None, **config) -> List[str]:
+        """
+        Extract many files across a process pool.
+
+        python-pptx/mammoth parsing is pure Python and holds the GIL, so
+        threads don't scale it. Each worker builds one extractor from
+        `config` (the __init__ keyword arguments) in its initializer, and only
+        paths and texts cross the process boundary.
+
+        Parameters
+        ----------
+        paths : list of str
+            Files to extract.
+        workers : int, optional
+            Number of processes, by default os.cpu_count().
+        **config
+            Keyword arguments for the extractor's __init__.
+
+        Returns
+        -------
+        list of str
+            Extracted text per path, in input order; files that fail are
+            logged and returned as "".
+        """
+        workers = workers or os.cpu_count() or 1
+        # a few chunks per worker amortizes IPC while keeping the load balanced
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(cls, config)) as executor:
+            return list(executor.map(_batch_worker_extract, paths, chunksize=chunksize))
+
+    async def aextract(self, path: str) -> str:
+        if self._needs_com(path):
+            return await asyncio.get_running_loop().run_in_executor(_COM_EXECUTOR, self, path)
+        return await super().aextract(path)
+
+    @abstractmethod
+    def _extract(self, path: str) -> str:
+        """Extract text from path without consulting the cache."""
+
+    @abstractmethod
+    def _config_key(self) -> str:
+        """Summary of the init options that change the extracted text."""
+
+    def _needs_com(self, path: str) -> bool:
+        """Whether extracting path would go through Office COM."""
+        return False
+
+class WordFileTextExtractor(_CachedExtractor, FileTextExtractor):
     """
     Windows-friendly text extractor for Word formats.
-    - DOCX/DOCM: mammoth -> markdown (fallback python-docx)
+    - DOCX/DOCM: mammoth -> raw text, or markdown with markdown=True
+                 (fallback: stream word/document.xml)
     - DOC/RTF:   convert via Word COM to TXT (fast, reliable) then read
                  (fallback to pandoc or striprtf if Word isn't installed)
     """
     file_extensions: List[str] = ["docx", "docm", "doc", "rtf"]
 
+    # extension -> (method name, extra args)
+    _DISPATCH: dict[str, tuple] = {
+        "docx": ("_extract_docx",),
+        "docm": ("_extract_docx",),
+        "doc": ("_extract_legacy", "doc"),
+        "rtf": ("_extract_legacy", "rtf"),
+    }
+
     def __init__(self, use_mammoth: bool = True, use_word_com: bool = True,
-                 pandoc_path: str | None = None):
+                 pandoc_path: str | None = None, use_cache: bool = False,
+                 markdown: bool = False):
         super().__init__()
         self.use_mammoth  = use_mammoth
         self.use_word_com = use_word_com
         self.pandoc_path  = pandoc_path
+        self.use_cache    = use_cache
+        self.markdown     = markdown  # embedding only needs plain text
+        self._word = None  # Word.Application shared by extract_many
 
-    def __call__(self, path: str) -> str:
+    def _config_key(self) -> str:
+        return repr((self.use_mammoth, self.use_word_com, self.pandoc_path, self.markdown))
+
+    def _extract(self, path: str) -> str:
         """
         Determine extraction method for a Word document and return normalized text.
 
@@ -60,20 +470,46 @@ class WordFileTextExtractor(FileTextExtractor):
         logger.debug(f"Validated Word file path: {p}")
         ext = p.suffix.lower().lstrip('.')
         logger.debug(f"Word file extension detected: {ext}")
-        if ext in ("docx", "docm"):
-            text = self._extract_docx(str(p))
-        elif ext in ("doc", "rtf"):
-            text = self._extract_legacy(str(p), ext)
-        else:
-            raise ValueError(f"Unsupported Word extension: {ext}")
-        return text
+        try:
+            method, *args = self._DISPATCH[ext]
+        except KeyError:
+            raise ValueError(f"Unsupported Word extension: {ext}") from None
+        return getattr(self, method)(str(p), *args)
+
+    def extract_many(self, paths: List[str]) -> List[str]:
+        """
+        Extract several Word files, starting Word at most once for the batch.
+
+        Legacy .doc files otherwise pay for a Word start-up (and
+        CoInitialize) each. Word COM is single-threaded apartment, so call this
+        from one thread and don't share the instance with other threads while
+        it runs.
+
+        Parameters
+        ----------
+        paths : list of str
+            Paths to Word or RTF files.
+
+        Returns
+        -------
+        list of str
+            Extracted text per path, in input order; files that fail are
+            logged and returned as "".
+        """
+        needs_word = any(self._needs_com(p) for p in paths)
+        with _shared_com_app(self, "_word", "Word.Application", needs_word):
+            return _extract_each(self, paths)
+
+    def _needs_com(self, path: str) -> bool:
+        return self.use_word_com and Path(path).suffix.lower() == ".doc"
 
     # ---------- helpers ----------
     def _extract_docx(self, path: str) -> str:
         """
         Extract text from a DOCX/DOCM file.
 
-        Tries mammoth to convert to Markdown, falling back to python-docx.
+        Tries mammoth (raw text, or Markdown when self.markdown is set),
+        falling back to a plain-text walk of the document XML.
 
         Parameters
         ----------
@@ -88,21 +524,53 @@ class WordFileTextExtractor(FileTextExtractor):
         if self.use_mammoth:
             try:
                 with open(path, "rb") as f:
-                    return mammoth.convert_to_markdown(f).value
+                    if self.markdown:
+                        return mammoth.convert_to_markdown(f, **_MAMMOTH_OPTIONS).value
+                    # skips the HTML/Markdown rendering and escaping passes
+                    return mammoth.extract_raw_text(f).value
             except Exception:
-                pass  # fall through to python-docx
+                pass  # fall through to the XML walk
+
+        return self._docx_xml_text(path)
+
+    def _docx_xml_text(self, path: str) -> str:
+        """
+        Stream the text of word/document.xml, one line per non-blank paragraph.
 
-        doc = Document(path)
+        Reads the <w:t> runs with lxml iterparse straight from the zip instead
+        of building python-docx's paragraph/run/cell object tree. Paragraphs
+        inside tables come out in document order; tabs and line breaks inside
+        a paragraph are kept as tab and newline characters.
+
+        Parameters
+        ----------
+        path : str
+            Path to the DOCX/DOCM file.
+
+        Returns
+        -------
+        str
+            Paragraph text joined with newlines.
+        """
         parts = []
-        for p in doc.paragraphs:
-            if p.text.strip():
-                parts.append(p.text)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    t = cell.text.strip()
-                    if t:
-                        parts.append(t)
+        runs = []
+        with zipfile.ZipFile(path) as z, z.open("word/document.xml") as f:
+            for _, el in etree.iterparse(f, events=("end",), tag=(_W_P, _W_T, _W_TAB, _W_BR)):
+                tag = el.tag
+                if tag == _W_T:
+                    if el.text:
+                        runs.append(el.text)
+                elif tag == _W_TAB:
+                    runs.append("\t")
+                elif tag == _W_BR:
+                    runs.append("\n")
+                else:
+                    para = "".join(runs)
+                    runs.clear()
+                    if para.strip():
+                        parts.append(para)
+                    # finished paragraphs are not needed again
+                    el.clear()
         return "\n".join(parts)
 
     def _extract_legacy(self, path: str, ext: str) -> str:
@@ -128,10 +596,9 @@ class WordFileTextExtractor(FileTextExtractor):
         RuntimeError
             If no viable extraction method is available.
         """
-        # For RTF files, bypass COM to avoid potential hangs and use striprtf directly
+        # For RTF files, bypass COM to avoid potential hangs and parse directly
         if ext == "rtf":
-            with open(path, "r", encoding="latin-1", errors="ignore") as f:
-                return rtf_to_text(f.read())
+            return self._rtf_to_text(path)
 
         if self.use_word_com:
             try:
@@ -144,41 +611,72 @@ class WordFileTextExtractor(FileTextExtractor):
 
         raise RuntimeError(f"No viable method to extract text from legacy Word file on Windows:\n{path}")
 
+    def _rtf_to_text(self, path: str) -> str:
+        """
+        Extract text from an RTF file.
+
+        Large files go to unrtf when it is installed. Otherwise (or if unrtf
+        fails) embedded image/object groups are cut out with a brace scan
+        before striprtf tokenizes the rest, since for image-heavy files they
+        are nearly all of the input.
+        """
+        unrtf = shutil.which("unrtf")
+        if unrtf and os.path.getsize(path) >= RTF_UNRTF_MIN_BYTES:
+            try:
+                result = subprocess.run([unrtf, "--text", path], check=True, capture_output=True)
+                return _strip_unrtf_header(result.stdout.decode("utf-8", errors="ignore"))
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"unrtf failed for {path} ({e}); using striprtf")
+
+        with open(path, "r", encoding="latin-1", errors="ignore") as f:
+            return rtf_to_text(_strip_rtf_binary_groups(f.read()))
+
     def _word_com_to_txt(self, path: str) -> str:
         """
         Use Microsoft Word via COM to SaveAs TXT, then read.
+
+        Reuses the Word instance of a running extract_many batch, otherwise
+        starts (and quits) one for this file.
         """
-        # Constants from Word Object Model (avoid importing win32com.constants each call)
-        wdFormatText = 2
+        if self._word is not None:
+            return self._word_save_as_txt(self._word, path)
         # Use the com_app context manager for CoInitialize/CoUninitialize
         with com_app("Word.Application", visible=False) as word:
-            try:
-                word.DisplayAlerts = 0
-            except AttributeError:
-                pass
-            doc = word.Documents.Open(
-                str(Path(path).absolute()),
-                ConfirmConversions=False,
-                ReadOnly=True,
-                AddToRecentFiles=False,
-                Visible=False,
-                Revert=False
-            )
+            return self._word_save_as_txt(word, path)
+
+    @staticmethod
+    def _word_save_as_txt(word, path: str) -> str:
+        # Constants from Word Object Model (avoid importing win32com.constants each call)
+        wdFormatText = 2
+        try:
+            word.DisplayAlerts = 0
+        except AttributeError:
+            pass
+        doc = word.Documents.Open(
+            str(Path(path).absolute()),
+            ConfirmConversions=False,
+            ReadOnly=True,
+            AddToRecentFiles=False,
+            Visible=False,
+            Revert=False
+        )
+        try:
             with tempfile.TemporaryDirectory() as td:
                 out_txt = Path(td) / (Path(path).stem + ".txt")
                 doc.SaveAs2(str(out_txt), FileFormat=wdFormatText, Encoding=65001)
-                doc.Close()
                 return out_txt.read_text(encoding="utf-8", errors="ignore")
+        finally:
+            # a shared Word instance must not keep documents open between files
+            doc.Close(SaveChanges=False)
 
     def _pandoc_to_txt(self, path: str) -> str:
         """
-        Convert a document to plain text via Pandoc using run_pandoc helper.
+        Convert a document to plain text via Pandoc, reading its stdout.
         """
-        out = run_pandoc(path, self.pandoc_path, to_format="plain")
-        return out.read_text(encoding="utf-8", errors="ignore")
+        return pandoc_to_text(path, self.pandoc_path, to_format="plain")
 
 
-class SpreadsheetTextExtractor(FileTextExtractor):
+class SpreadsheetTextExtractor(_CachedExtractor, FileTextExtractor):
     """
     Flatten spreadsheet content into plain text for embedding.
     """
@@ -191,15 +689,23 @@ class SpreadsheetTextExtractor(FileTextExtractor):
                  include_formulas: bool = False,    # needs engine support
                  max_rows: int | None = 5000,
                  max_cols: int | None = 50,
-                 delimiter: str = "\t"):
+                 delimiter: str = "\t",
+                 use_cache: bool = False,
+                 parallel_sheets: bool = False):    # CLI/batch only, never in request handlers
         self.sheets = sheets
         self.include_headers = include_headers
         self.include_formulas = include_formulas
         self.max_rows = max_rows
         self.max_cols = max_cols
         self.delimiter = delimiter
+        self.use_cache = use_cache
+        self.parallel_sheets = parallel_sheets
 
-    def __call__(self, path: str) -> str:
+    def _config_key(self) -> str:
+        return repr((self.sheets, self.include_headers, self.include_formulas,
+                     self.max_rows, self.max_cols, self.delimiter))
+
+    def _extract(self, path: str) -> str:
         """
         Read and normalize text from spreadsheet or delimited files.
 
@@ -240,6 +746,12 @@ class SpreadsheetTextExtractor(FileTextExtractor):
         """
         Read plain text from CSV or TSV files.
 
+        The file is read line by line and reading stops after max_rows data
+        lines (plus the header), so large files are never loaded whole. Lines
+        are kept verbatim: max_cols and self.delimiter are not applied, because
+        splitting on the separator would break quoted fields that contain it,
+        and a real CSV parse would change the text of malformed files.
+
         Parameters
         ----------
         p : Path
@@ -250,12 +762,11 @@ class SpreadsheetTextExtractor(FileTextExtractor):
         Returns
         -------
         str
-            Raw file content.
+            Raw file content, up to max_rows + 1 lines.
         """
-        sep = "\t" if ext == "tsv" else ","
+        max_lines = self.max_rows + 1 if self.max_rows else None  # +1: header row
         with open(p, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-        return text
+            return "".join(itertools.islice(f, max_lines))
 
     def _read_excel_like(self, p: Path, ext: str) -> str:
         """
@@ -273,27 +784,208 @@ class SpreadsheetTextExtractor(FileTextExtractor):
         str
             Combined text content from selected sheets.
         """
+        if ext in ("xlsx", "xlsm"):
+            return self._read_xlsx(p)
+
         # choose engine
         engine = self._pick_engine(ext)
 
-        parts = []
         with pd.ExcelFile(p, engine=engine) as excel_file:
-            sheet_names = excel_file.sheet_names
-            if self.sheets == "first":
-                sheet_names = sheet_names[:1]
-            elif isinstance(self.sheets, list):
-                sheet_names = [s for s in sheet_names if s in self.sheets]
+            sheet_names = self._select_sheets(excel_file.sheet_names)
+            if not self._parallel_sheets(p, sheet_names):
+                return "\n\n".join(
+                    self._frame_text(excel_file.parse(sheet_name=s, **self._parse_limits()), s)
+                    for s in sheet_names
+                )
 
-            for s in sheet_names:
-                df = excel_file.parse(sheet_name=s, engine=engine)
+        return "\n\n".join(self._map_sheets(p, ext, sheet_names))
 
-                if self.max_rows: df = df.head(self.max_rows)
-                if self.max_cols: df = df.iloc[:, :self.max_cols]
+    def _read_xlsx(self, p: Path) -> str:
+        """
+        Stream text out of .xlsx/.xlsm workbooks with openpyxl's read-only mode.
 
-                txt = self._df_to_text(df, sheet=s)
-                parts.append(txt)
+        Rows are read lazily from the sheet XML and reading stops after
+        max_rows (plus the header row), so no DataFrame or full worksheet DOM
+        is built.
 
-        return "\n\n".join(parts)
+        Parameters
+        ----------
+        p : Path
+            Path to the workbook.
+
+        Returns
+        -------
+        str
+            Combined text content from selected sheets.
+        """
+        if not self.include_formulas:
+            try:
+                with zipfile.ZipFile(p) as z:
+                    sheet_names = self._select_sheets(list(_xlsx_package(z)[0]))
+                    if not self._parallel_sheets(p, sheet_names):
+                        return "\n\n".join(self._fast_xlsx_text(z, sheet_names))
+                return "\n\n".join(self._map_sheets(p, "xlsx", sheet_names))
+            except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+                logger.debug(f"Falling back to openpyxl for {p}: {e}")
+
+        wb = self._open_xlsx(p)
+        try:
+            # skip chartsheets, which have no cells
+            sheet_names = [s for s in self._select_sheets(wb.sheetnames) if hasattr(wb[s], "iter_rows")]
+            if not self._parallel_sheets(p, sheet_names):
+                return "\n\n".join(self._xlsx_sheet_text(wb, s) for s in sheet_names)
+        finally:
+            # read-only workbooks keep the zip open until closed
+            wb.close()
+
+        return "\n\n".join(self._map_sheets(p, "xlsx", sheet_names))
+
+    def _fast_xlsx_text(self, z: zipfile.ZipFile, sheet_names: List[str]) -> List[str]:
+        """
+        Text of the given sheets, read straight from the package XML.
+
+        Used when formulas aren't wanted: only the shared-strings table, the
+        cell-format list (to spot dates) and each sheet's cached <v> values
+        are parsed, with no workbook object or per-cell dicts. Output matches
+        the openpyxl path.
+
+        Parameters
+        ----------
+        z : zipfile.ZipFile
+            The open workbook package.
+        sheet_names : list of str
+            Worksheets to extract, in output order.
+
+        Returns
+        -------
+        list of str
+            One text block per sheet.
+        """
+        sheets, strings_part, styles_part, epoch = _xlsx_package(z)
+        strings = []
+        if strings_part:
+            with z.open(strings_part) as f:
+                strings = read_string_table(f)
+        date_styles = timedelta_styles = frozenset()
+        if styles_part:
+            stylesheet = Stylesheet.from_tree(openpyxl_fromstring(z.read(styles_part)))
+            date_styles, timedelta_styles = stylesheet.date_formats, stylesheet.timedelta_formats
+
+        max_row = self.max_rows + 1 if self.max_rows else None  # +1: header row
+        texts = []
+        for sheet in sheet_names:
+            with z.open(sheets[sheet]) as f:
+                rows = _xlsx_rows(f, strings, date_styles, timedelta_styles, epoch,
+                                  max_row=max_row, max_col=self.max_cols)
+                texts.append(self._rows_to_text(rows, sheet=sheet))
+        return texts
+
+    def _open_xlsx(self, p: Path):
+        """
+        Load a workbook for text extraction only.
+
+        read_only streams rows instead of building the worksheet DOM,
+        data_only returns cached results instead of formula strings, and
+        keep_links=False skips loading external-link parts. (pandas' own
+        openpyxl reader uses the same settings.)
+        """
+        return openpyxl.load_workbook(p, read_only=True, data_only=not self.include_formulas, keep_links=False)
+
+    def _xlsx_sheet_text(self, wb, sheet: str) -> str:
+        max_row = self.max_rows + 1 if self.max_rows else None  # +1: header row
+        rows = wb[sheet].iter_rows(max_row=max_row, max_col=self.max_cols, values_only=True)
+        return self._rows_to_text(rows, sheet=sheet)
+
+    def _parse_limits(self) -> dict:
+        # pandas hands nrows down to the engine, which stops reading rows there
+        # instead of parsing the whole sheet for head() to throw away. Columns
+        # are still cut afterwards: positional usecols raises on sheets
+        # narrower than max_cols.
+        return {"nrows": self.max_rows or None}
+
+    def _frame_text(self, df: pd.DataFrame, sheet: str) -> str:
+        if self.max_rows: df = df.head(self.max_rows)
+        if self.max_cols: df = df.iloc[:, :self.max_cols]
+        return self._df_to_text(df, sheet=sheet)
+
+    def _parallel_sheets(self, p: Path, sheet_names: List[str]) -> bool:
+        # opt-in: callers that already run one extraction per core (the web app)
+        # must not start pools of their own. Worker start-up and re-opening the
+        # workbook also only pay off for big files.
+        return self.parallel_sheets and len(sheet_names) > 1 and p.stat().st_size >= PARALLEL_SHEETS_MIN_BYTES
+
+    def _map_sheets(self, p: Path, ext: str, sheet_names: List[str]) -> List[str]:
+        """
+        Extract sheets in parallel worker processes, one sheet per task.
+
+        Sheet parsing (openpyxl, xlrd, odfpy) is pure Python and holds the GIL,
+        so processes rather than threads. Each worker opens its own copy of the
+        workbook; results keep the sheet order.
+        """
+        workers = min(len(sheet_names), os.cpu_count() or 1)
+        logger.debug(f"Extracting {len(sheet_names)} sheets from {p} with {workers} processes")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(functools.partial(self._sheet_text, p, ext), sheet_names))
+
+    def _sheet_text(self, p: Path, ext: str, sheet: str) -> str:
+        """Open the workbook and extract a single sheet (worker entry point)."""
+        if ext in ("xlsx", "xlsm") and not self.include_formulas:
+            with zipfile.ZipFile(p) as z:
+                return self._fast_xlsx_text(z, [sheet])[0]
+        if ext in ("xlsx", "xlsm"):
+            wb = self._open_xlsx(p)
+            try:
+                return self._xlsx_sheet_text(wb, sheet)
+            finally:
+                wb.close()
+        engine = self._pick_engine(ext)
+        return self._frame_text(pd.read_excel(p, sheet_name=sheet, engine=engine, **self._parse_limits()), sheet)
+
+    def _select_sheets(self, sheet_names: List[str]) -> List[str]:
+        if self.sheets == "first":
+            return sheet_names[:1]
+        if isinstance(self.sheets, list):
+            return [s for s in sheet_names if s in self.sheets]
+        return list(sheet_names)
+
+    def _rows_to_text(self, rows, sheet: str) -> str:
+        """
+        Serialize worksheet rows (first row = header) the way _df_to_text does.
+
+        Empty rows and columns with no data are dropped, empty cells become "",
+        and integral floats print without a trailing ".0", as pandas' openpyxl
+        reader converts them.
+
+        Parameters
+        ----------
+        rows : iterable of tuple
+            Cell values, row by row; the first row is the header.
+        sheet : str
+            Name of the sheet being processed.
+
+        Returns
+        -------
+        str
+            Tab-delimited text block with sheet name header.
+        """
+        rows = iter(rows)
+        header = [_cell_str(v) for v in next(rows, ())]
+        body = []
+        for row in rows:
+            cells = [_cell_str(v) for v in row]
+            if any(cells):
+                body.append(cells)
+
+        width = max([len(header)] + [len(r) for r in body])
+        keep = [c for c in range(width) if any(c < len(r) and r[c] for r in body)]
+
+        join = self.delimiter.join
+        lines = [f"=== Sheet: {sheet} ==="]
+        if self.include_headers:
+            lines.append(join(header[c] if c < len(header) else "" for c in keep))
+        lines.extend(join(r[c] if c < len(r) else "" for c in keep) for r in body)
+        lines.append("")
+        return "\n".join(lines)
 
     def _df_to_text(self, df: pd.DataFrame, sheet: str) -> str:
         """
@@ -314,16 +1006,18 @@ class SpreadsheetTextExtractor(FileTextExtractor):
         # Optionally drop completely empty cols/rows
         df = df.dropna(how="all").dropna(axis=1, how="all")
 
-        buf = io.StringIO()
-        buf.write(f"=== Sheet: {sheet} ===\n")
+        lines = [f"=== Sheet: {sheet} ==="]
         if self.include_headers:
-            buf.write(self.delimiter.join(str(c) for c in df.columns) + "\n")
+            lines.append(self.delimiter.join(str(c) for c in df.columns))
 
-        for _, row in df.iterrows():
-            cells = ["" if pd.isna(v) else str(v) for v in row.tolist()]
-            buf.write(self.delimiter.join(cells) + "\n")
+        # stringify column-wise in pandas rather than str() per cell; missing
+        # values (NaN/NaT/None/NA) come out as ""
+        cells = df.astype(str).where(df.notna(), "")
+        lines.extend(map(self.delimiter.join, cells.to_numpy().tolist()))
 
-        return buf.getvalue()
+        # every line, including the last, ends with a newline
+        lines.append("")
+        return "\n".join(lines)
 
     def _pick_engine(self, ext: str) -> str:
         """
@@ -344,38 +1038,40 @@ class SpreadsheetTextExtractor(FileTextExtractor):
         ImportError
             If the required engine is not installed and cannot be used.
         """
-        if ext in ("xlsx", "xlsm"):
-            return "openpyxl"
-        if ext == "xls":
-            # xlrd >=2 dropped xls; need xlrd==1.2 or fallback
-            try:
-                import xlrd  # noqa
-                return "xlrd"
-            except ImportError:
-                # try COM/LibreOffice conversion here, else raise
-                raise ImportError("xlrd 1.2.0 required for .xls, or convert to .xlsx first.")
-        if ext == "xlsb":
+        # unknown extensions fall back to openpyxl
+        engine, module, hint = _EXCEL_ENGINES.get(ext, _EXCEL_ENGINES["xlsx"])
+        if module is not None:
             try:
-                import pyxlsb  # noqa
-                return "pyxlsb"
+                importlib.import_module(module)
             except ImportError:
-                raise ImportError("pyxlsb required for .xlsb, or convert first.")
-        if ext == "ods":
-            try:
-                import odf  # noqa
-                return "odf"
-            except ImportError:
-                raise ImportError("odfpy required for .ods, or convert first.")
-        # fallback
-        return "openpyxl"
+                raise ImportError(hint)
+        return engine
+
+
+# extension -> (pandas engine, module the engine needs, hint if it's missing)
+_EXCEL_ENGINES = {
+    "xlsx": ("openpyxl", None, None),
+    "xlsm": ("openpyxl", None, None),
+    # xlrd >=2 dropped xls; need xlrd==1.2 or convert first
+    "xls": ("xlrd", "xlrd", "xlrd 1.2.0 required for .xls, or convert to .xlsx first."),
+    "xlsb": ("pyxlsb", "pyxlsb", "pyxlsb required for .xlsb, or convert first."),
+    "ods": ("odf", "odf", "odfpy required for .ods, or convert first."),
+}
+
+def _cell_str(v) -> str:
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
 
 
-class PresentationTextExtractor(FileTextExtractor):
+class PresentationTextExtractor(_CachedExtractor, FileTextExtractor):
     """
     Extract text from presentation files (PPTX/PPT/ODP/...) into plain text.
 
     Strategy:
-    - For pptx/pptm/ppsx: python-pptx
+    - For pptx/pptm/ppsx: slide XML via lxml (python-pptx for master slides)
     - For ppt/pps/odp:    convert → pptx or txt via COM or LibreOffice, then parse
     """
     file_extensions: List[str] = ["pptx", "pptm", "ppsx", "ppt", "pps", "odp"]
@@ -385,14 +1081,27 @@ class PresentationTextExtractor(FileTextExtractor):
                  include_master: bool = False,
                  use_com: bool = True,     # Windows PowerPoint COM
                  soffice_path: str | None = None,  # LibreOffice headless
-                 pandoc_path: str | None = None):
+                 pandoc_path: str | None = None,
+                 use_cache: bool = False,
+                 use_soffice_server: bool = True,  # via unoserver, if installed
+                 work_dir: str | Path | None = None):  # parent of conversion temp dirs
         self.include_notes = include_notes
         self.include_master = include_master
         self.use_com = use_com
         self.soffice_path = soffice_path
+        self.use_soffice_server = use_soffice_server
         self.pandoc_path = pandoc_path
+        self.use_cache = use_cache
+        self.work_dir = work_dir
+        self._powerpoint = None  # PowerPoint.Application shared by extract_many
+        self._batch_dir: Path | None = None  # conversion output dir of a running extract_many
+        self._preconverted: dict = {}  # source path -> output of the batch soffice run
 
-    def __call__(self, path: str) -> str:
+    def _config_key(self) -> str:
+        return repr((self.include_notes, self.include_master, self.use_com,
+                     self.soffice_path, self.pandoc_path))
+
+    def _extract(self, path: str) -> str:
         """
         Extract and normalize text from presentation files.
 
@@ -418,50 +1127,100 @@ class PresentationTextExtractor(FileTextExtractor):
         else:
             # ppt, pps, odp → convert
             converted = self._convert_to_pptx_or_txt(str(p), ext)
-            if converted.suffix.lower() == ".txt":
-                text = converted.read_text(encoding="utf-8", errors="ignore")
-            else:
-                text = self._extract_pptx(str(converted))
+            try:
+                if converted.suffix.lower() == ".txt":
+                    text = converted.read_text(encoding="utf-8", errors="ignore")
+                else:
+                    # one read into memory; python-pptx then parses the zip
+                    # from the buffer, and the temp file can go right away
+                    text = self._extract_pptx(io.BytesIO(converted.read_bytes()))
+            finally:
+                # each conversion writes into its own temp directory, except the
+                # batch soffice run, whose directory extract_many removes
+                if str(p.absolute()) not in self._preconverted:
+                    shutil.rmtree(converted.parent, ignore_errors=True)
         # normalize whitespace
         return text
 
+    def extract_many(self, paths: List[str]) -> List[str]:
+        """
+        Extract several presentations, starting PowerPoint at most once for the batch.
+
+        Only legacy .ppt/.pps files go through PowerPoint COM. Files bound for
+        LibreOffice are converted up front with a single soffice run (when no
+        LibreOffice server is in use). All conversion output goes to one
+        temporary directory, under work_dir if set, that is removed when the
+        batch ends. As with Word, call this from a single thread.
+
+        Parameters
+        ----------
+        paths : list of str
+            Paths to presentation files.
+
+        Returns
+        -------
+        list of str
+            Extracted text per path, in input order; files that fail are
+            logged and returned as "".
+        """
+        needs_com = any(self._needs_com(p) for p in paths)
+        with tempfile.TemporaryDirectory(dir=self.work_dir, ignore_cleanup_errors=True) as batch_dir, \
+                _shared_com_app(self, "_powerpoint", "PowerPoint.Application", needs_com):
+            self._batch_dir = Path(batch_dir)
+            try:
+                if self.soffice_path and not (self.use_soffice_server and _HAS_UNOSERVER):
+                    # odp always goes to LibreOffice; ppt/pps do when COM is off
+                    via_soffice = [str(Path(p).absolute()) for p in paths
+                                   if Path(p).suffix.lower() == ".odp"
+                                   or (not self.use_com and Path(p).suffix.lower() in (".ppt", ".pps"))]
+                    if len(via_soffice) > 1:
+                        self._preconverted = self._libreoffice_convert_many(via_soffice, "pptx")
+                return _extract_each(self, paths)
+            finally:
+                self._batch_dir = None
+                self._preconverted = {}
+
+    def _needs_com(self, path: str) -> bool:
+        return self.use_com and Path(path).suffix.lower() in (".ppt", ".pps")
+
     # ---------- pptx path ----------
-    def _extract_pptx(self, path: str) -> str:
+    def _extract_pptx(self, path) -> str:
         """
-        Extract text from PPTX/PPTM/PPSX using python-pptx.
+        Extract text from PPTX/PPTM/PPSX.
+
+        Slide text is read straight from the slide XML parts (see
+        _pptx_xml_text). python-pptx is used when master slides are requested
+        or the package can't be read that way.
 
         Parameters
         ----------
-        path : str
-            Path to the .pptx/.pptm/.ppsx file.
+        path : str or file-like
+            Path to the .pptx/.pptm/.ppsx file, or a binary buffer holding one.
 
         Returns
         -------
         str
             Combined slide and (optionally) master text.
         """
+        if not self.include_master:
+            try:
+                return self._pptx_xml_text(path)
+            except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+                logger.debug(f"Falling back to python-pptx for {path}: {e}")
+                if hasattr(path, "seek"):
+                    path.seek(0)
+
         from pptx import Presentation
         prs = Presentation(path)
 
         parts = []
         for idx, slide in enumerate(prs.slides, start=1):
-            buf = io.StringIO()
-            buf.write(f"=== Slide {idx} ===\n")
-            # Slide title (if any)
-            if slide.shapes.title and slide.shapes.title.text:
-                buf.write(slide.shapes.title.text.strip() + "\n")
-            # All shapes
-            for shape in slide.shapes:
-                txt = self._shape_text(shape)
-                if txt:
-                    buf.write(txt + "\n")
-            # Notes
+            title = slide.shapes.title.text if slide.shapes.title else ""
+            shape_texts = [txt for txt in map(self._shape_text, slide.shapes) if txt]
+            notes = ""
             if self.include_notes and slide.has_notes_slide:
-                notes_txt = slide.notes_slide.notes_text_frame.text
-                if notes_txt.strip():
-                    buf.write("\n--- Notes ---\n")
-                    buf.write(notes_txt.strip() + "\n")
-            parts.append(buf.getvalue())
+                notes = slide.notes_slide.notes_text_frame.text
+            parts.append(self._slide_text(idx, title, shape_texts, notes))
 
         # Master slides (rarely needed)
         if self.include_master:
@@ -469,6 +1228,81 @@ class PresentationTextExtractor(FileTextExtractor):
 
         return "\n\n".join(parts)
 
+    def _pptx_xml_text(self, path) -> str:
+        """
+        Extract slide (and notes) text by walking the slide XML with lxml.
+
+        Produces the same text as the python-pptx path without building its
+        shape/paragraph/run object tree. Slides are taken in presentation
+        order (p:sldIdLst), not file-name order.
+
+        Parameters
+        ----------
+        path : str or file-like
+            Path to the .pptx/.pptm/.ppsx file, or a binary buffer holding one.
+
+        Returns
+        -------
+        str
+            Combined slide text.
+        """
+        parts = []
+        with zipfile.ZipFile(path) as z:
+            pres_rels = _zip_rels(z, "ppt/presentation.xml")
+            pres = etree.fromstring(z.read("ppt/presentation.xml"))
+            sld_ids = pres.find(_P_NS + "sldIdLst")
+            slide_parts = [] if sld_ids is None else [pres_rels[s.get(_R_ID)][1] for s in sld_ids]
+
+            for idx, part in enumerate(slide_parts, start=1):
+                sp_tree = etree.fromstring(z.read(part)).find(f"{_P_NS}cSld/{_P_NS}spTree")
+                title = ""
+                shape_texts = []
+                if sp_tree is not None:
+                    # title = first top-level placeholder with idx 0 (python-pptx's shapes.title)
+                    for el in sp_tree.iterchildren():
+                        ph = _placeholder(el) if el.tag in _P_SHAPE_TAGS else None
+                        if ph is not None and ph.get("idx", "0") == "0":
+                            tx_body = el.find(_P_NS + "txBody")
+                            if tx_body is not None:
+                                title = "\n".join(_dml_paragraphs(tx_body))
+                            break
+                    _sp_tree_texts(sp_tree, shape_texts)
+
+                notes = ""
+                if self.include_notes:
+                    notes_part = next((target for rel_type, target in _zip_rels(z, part).values()
+                                       if rel_type.endswith("/notesSlide")), None)
+                    if notes_part:
+                        notes = self._notes_xml_text(etree.fromstring(z.read(notes_part)))
+                parts.append(self._slide_text(idx, title, shape_texts, notes))
+
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _notes_xml_text(notes) -> str:
+        # the notes body placeholder, as python-pptx's notes_text_frame
+        for el in notes.iterfind(f"{_P_NS}cSld/{_P_NS}spTree/{_P_NS}sp"):
+            ph = _placeholder(el)
+            if ph is not None and ph.get("type") == "body":
+                tx_body = el.find(_P_NS + "txBody")
+                return "" if tx_body is None else "\n".join(_dml_paragraphs(tx_body))
+        return ""
+
+    @staticmethod
+    def _slide_text(idx: int, title: str, shape_texts: List[str], notes: str) -> str:
+        """Format one slide's text block (shared by the XML and python-pptx paths)."""
+        lines = [f"=== Slide {idx} ==="]
+        # Slide title (if any)
+        if title:
+            lines.append(title.strip())
+        # All shapes
+        lines.extend(shape_texts)
+        # Notes
+        if notes.strip():
+            lines.extend(("", "--- Notes ---", notes.strip()))
+        lines.append("")
+        return "\n".join(lines)
+
     def _shape_text(self, shape) -> str:
         """
         Retrieve text content from a slide shape.
@@ -483,24 +1317,22 @@ class PresentationTextExtractor(FileTextExtractor):
         str
             Extracted text, multi-line for tables or grouped shapes.
         """
-        # text frame
-        if hasattr(shape, "text_frame") and shape.text_frame:
-            return "\n".join([p.text for p in shape.text_frame.paragraphs if p.text.strip()])
-        # table
+        # text frame; paragraph.text re-joins the runs on every access, so read it once
+        if shape.has_text_frame:
+            texts = (p.text for p in shape.text_frame.paragraphs)
+            return "\n".join(t for t in texts if t and not t.isspace())
+        # table; rows with no text at all are skipped
         if shape.has_table:
             rows = []
             for r in shape.table.rows:
                 cells = [c.text.strip() for c in r.cells]
-                rows.append("\t".join(cells))
+                if any(cells):
+                    rows.append("\t".join(cells))
             return "\n".join(rows)
         # grouped shapes recurse
         if shape.shape_type == 6 and hasattr(shape, "shapes"):  # MSO_SHAPE_TYPE.GROUP = 6
-            parts = []
-            for sh in shape.shapes:
-                txt = self._shape_text(sh)
-                if txt:
-                    parts.append(txt)
-            return "\n".join(parts)
+            texts = (self._shape_text(sh) for sh in shape.shapes)
+            return "\n".join(t for t in texts if t)
         return ""
 
     def _master_text(self, prs) -> str:
@@ -517,14 +1349,14 @@ class PresentationTextExtractor(FileTextExtractor):
         str
             Text content from all master slides.
         """
-        buf = io.StringIO()
-        buf.write("=== Master Slides ===\n")
+        lines = ["=== Master Slides ==="]
         for master in prs.slide_masters:
             for shape in master.shapes:
                 txt = self._shape_text(shape)
                 if txt:
-                    buf.write(txt + "\n")
-        return buf.getvalue()
+                    lines.append(txt)
+        lines.append("")
+        return "\n".join(lines)
 
     # ---------- conversion path ----------
     def _convert_to_pptx_or_txt(self, path: str, ext: str) -> Path:
@@ -550,6 +1382,11 @@ class PresentationTextExtractor(FileTextExtractor):
         RuntimeError
             If conversion fails and no valid output is produced.
         """
+        # already converted by extract_many's batch soffice run
+        pre = self._preconverted.get(str(Path(path).absolute()))
+        if pre is not None:
+            return pre
+
         # Try COM first
         if self.use_com and ext in ("ppt", "pps"):
             try:
@@ -576,19 +1413,32 @@ class PresentationTextExtractor(FileTextExtractor):
     def _ppt_com_to_pptx(self, path: str) -> Path:
         """
         Convert legacy PPT/PPS to PPTX via PowerPoint COM using com_app.
+
+        Reuses the PowerPoint instance of a running extract_many batch.
         """
+        if self._powerpoint is not None:
+            return self._ppt_save_as_pptx(self._powerpoint, path, self._output_dir())
         with com_app("PowerPoint.Application", visible=False) as powerpoint:
-            tempdir = Path(tempfile.mkdtemp())
-            out_path = tempdir / (Path(path).stem + ".pptx")
-            pres = powerpoint.Presentations.Open(str(Path(path).absolute()), WithWindow=False)
+            return self._ppt_save_as_pptx(powerpoint, path, self._output_dir())
+
+    @staticmethod
+    def _ppt_save_as_pptx(powerpoint, path: str, out_dir: Path) -> Path:
+        out_path = out_dir / (Path(path).stem + ".pptx")
+        pres = powerpoint.Presentations.Open(str(Path(path).absolute()), WithWindow=False)
+        try:
             pres.SaveAs(str(out_path), 24)  # ppSaveAsOpenXMLPresentation = 24
+        finally:
             pres.Close()
-            return out_path
+        return out_path
 
     def _libreoffice_convert(self, src: str, fmt: str) -> Path:
         """
         Convert a file using LibreOffice headless mode.
 
+        With unoserver installed (and use_soffice_server set) the conversion
+        goes to a long-lived LibreOffice server; otherwise, or if that fails,
+        soffice is spawned for this one file.
+
         Parameters
         ----------
         src : str
@@ -606,12 +1456,71 @@ class PresentationTextExtractor(FileTextExtractor):
         subprocess.CalledProcessError
             If the LibreOffice command fails.
         """
-        import subprocess, tempfile
-        outdir = Path(tempfile.mkdtemp())
+        outdir = self._output_dir()
+        if self.use_soffice_server and _HAS_UNOSERVER:
+            out = outdir / f"{Path(src).stem}.{fmt}"
+            try:
+                _soffice_client(self.soffice_path).convert(
+                    inpath=str(Path(src).absolute()), outpath=str(out), convert_to=fmt
+                )
+                return out
+            except Exception as e:
+                logger.warning(f"LibreOffice server conversion failed for {src} ({e}); spawning soffice")
+
         cmd = [self.soffice_path, "--headless", "--convert-to", fmt, "--outdir", str(outdir), src]
         subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         return next(outdir.glob(f"{Path(src).stem}*.{fmt}"))
 
+    def _libreoffice_convert_many(self, srcs: List[str], fmt: str) -> dict:
+        """
+        Convert several files with as few soffice runs as possible.
+
+        soffice accepts many inputs per run but names each output after its
+        input's stem, so inputs sharing a stem are spread over extra runs.
+        Outputs land in the batch directory; files that did not convert are
+        simply missing from the result and take the per-file path later.
+
+        Parameters
+        ----------
+        srcs : list of str
+            Absolute source file paths.
+        fmt : str
+            Desired output format (e.g., 'pptx').
+
+        Returns
+        -------
+        dict
+            Source path -> converted file, for the files that converted.
+        """
+        converted = {}
+        pending = list(dict.fromkeys(srcs))
+        while pending:
+            batch, rest, stems = [], [], set()
+            for src in pending:
+                stem = Path(src).stem
+                if stem in stems:
+                    rest.append(src)
+                else:
+                    stems.add(stem)
+                    batch.append(src)
+            outdir = self._output_dir()
+            cmd = [self.soffice_path, "--headless", "--convert-to", fmt, "--outdir", str(outdir), *batch]
+            logger.debug(f"Converting {len(batch)} files in one soffice run")
+            try:
+                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            except (OSError, subprocess.CalledProcessError) as e:
+                logger.warning(f"Batch LibreOffice conversion failed ({e}); converting per file")
+            for src in batch:
+                out = outdir / f"{Path(src).stem}.{fmt}"
+                if out.exists():
+                    converted[src] = out
+            pending = rest
+        return converted
+
+    def _output_dir(self) -> Path:
+        """New temp directory for one conversion (inside the batch directory during extract_many)."""
+        return Path(tempfile.mkdtemp(dir=self._batch_dir or self.work_dir))
+
     def _pandoc_to_txt(self, src: str) -> Path:
         """
         Fallback conversion of a presentation file to plain text via Pandoc.
@@ -1,7 +1,9 @@
 # text_extraction/pdf_extractor.py
 
 import fitz
+import hashlib
 import logging
+import numpy as np
 
 # Raise the maximum number of pixels for images to prevent errors with large PDFs
 try:
@@ -11,18 +13,80 @@ except ImportError:
     pass
 
 import io
-import ocrmypdf
 import os
-import shutil
+
+# ocrmypdf already runs `jobs` Tesseract processes; keep each one single-threaded
+# so OpenMP threads don't oversubscribe the cores
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+# Prefer the "fast" Tesseract models (tessdata_fast: integer LSTMs, 2-3x quicker
+# on printed documents at nearly the same accuracy) when they are installed next
+# to this module. Setting TESSDATA_PREFIX yourself, e.g. to a tessdata_best
+# directory, takes precedence.
+_TESSDATA_FAST = os.path.join(os.path.dirname(__file__), "tessdata_fast")
+if os.path.isdir(_TESSDATA_FAST):
+    os.environ.setdefault("TESSDATA_PREFIX", _TESSDATA_FAST)
+
+import ocrmypdf
 import tempfile
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Union, List
 from .basic_extraction import FileTextExtractor
-from .extraction_utils import validate_file
+from .extraction_utils import validate_file, get_text_cache
 
 logger = logging.getLogger(__name__)
 
+# with parallel_pages on, documents with at least this many pages extract their
+# text layer in parallel processes
+PARALLEL_PAGES_MIN = 64
+# most page ranges handed out per document
+PARALLEL_PAGES_MAX_WORKERS = 8
+
+# get_text flags: PyMuPDF's "text" defaults minus ligature and whitespace
+# preservation. Ligatures come out as plain letters ("fi", not U+FB01) and
+# whitespace gets normalized downstream anyway.
+TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+
+def _ocr_cache_key(pdf_path: Path, ocr_params: dict) -> bytes:
+    """
+    Cache key for the OCR text of a PDF: a BLAKE2b digest of the file's bytes
+    and the OCR parameters, so copies and moved files hit the same entry.
+    """
+    with open(pdf_path, "rb") as f:
+        h = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+    # the worker count doesn't change the text
+    params = sorted((k, repr(v)) for k, v in ocr_params.items() if k != 'jobs')
+    h.update(f"|ocr|{params}".encode("utf-8"))
+    return h.digest()
+
+def _page_range_text(path: Path, start: int, stop: int) -> str:
+    """Open the PDF and return the text of pages [start, stop) (worker entry point)."""
+    with fitz.open(path) as doc:
+        return "".join(doc[i].get_text(flags=TEXT_FLAGS) for i in range(start, stop))
+
+# per-process extractor used by extract_many workers
+_worker_extractor = None
+
+def _init_worker(extractor) -> None:
+    global _worker_extractor
+    # the pool already has a process per core: single-threaded Tesseract,
+    # one OCR job and no nested page-range pools inside each worker
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    os.environ["OMP_NUM_THREADS"] = "1"
+    extractor.parallel_pages = False
+    extractor.ocr_params = {**extractor.ocr_params, 'jobs': 1}
+    _worker_extractor = extractor
+
+def _worker_extract(path: str) -> str:
+    try:
+        return _worker_extractor(path)
+    except Exception as e:
+        logger.error(f"Failed to extract {path}: {e}")
+        return ""
+
 class PDFFile:
     """
     Represents a PDF file and provides properties and utilities
@@ -57,14 +121,19 @@ class PDFFile:
         True if any page qualifies as a large‐format page.
     """
     
-    def __init__(self, path: str):
+    def __init__(self, path: str, doc: fitz.Document = None):
         """
         Initialize a PDFFile instance.
 
+        The document is opened (or `doc` read) once; page count, encryption
+        and page dimensions are all gathered from that single parse.
+
         Parameters
         ----------
         path : str
             Path to the PDF file.
+        doc : fitz.Document, optional
+            The same file already opened by the caller, so it isn't parsed twice.
 
         Raises
         ------
@@ -84,31 +153,60 @@ class PDFFile:
             logger.error(f"PDF path is not a file: {self.path}")
             raise FileNotFoundError(f"PDF file is not a file: {path}")
 
-        with fitz.open(self.path) as doc:
-            # if the file is not a PDF, raise an error
-            if not doc.is_pdf:
-                logger.error(f"File is not a valid PDF: {self.path}")
-                raise ValueError(f"File is not a valid PDF: {self.path}")
-            
-            self.page_count = doc.page_count
-            self.is_encrypted = doc.is_encrypted
-        logger.debug(f"PDFFile {self.path} has {self.page_count} pages; encrypted={self.is_encrypted}")
-
         self.name = self.path.stem
         self.size = self.path.stat().st_size  # size in bytes
         # cache for properties that are expensive to compute and not used much
         self.property_cache = {}
 
+        if doc is None:
+            with fitz.open(self.path) as doc:
+                self._load_metadata(doc)
+        else:
+            self._load_metadata(doc)
+        logger.debug(f"PDFFile {self.path} has {self.page_count} pages; encrypted={self.is_encrypted}")
+
+    def _load_metadata(self, doc: fitz.Document):
+        """
+        Read page count, encryption and page dimensions from an open document.
+
+        Parameters
+        ----------
+        doc : fitz.Document
+            The opened PDF.
+
+        Raises
+        ------
+        ValueError
+            If the document is not a PDF.
+        """
+        # if the file is not a PDF, raise an error
+        if not doc.is_pdf:
+            logger.error(f"File is not a valid PDF: {self.path}")
+            raise ValueError(f"File is not a valid PDF: {self.path}")
+
+        self.page_count = doc.page_count
+        self.is_encrypted = doc.is_encrypted
+        # pages of an encrypted document can't be loaded without the password
+        n = 0 if self.is_encrypted else self.page_count
+        rects = (page.rect for page in doc) if n else ()
+        # (width, height) in points, one row per page; converted to inches in one step
+        sizes = np.fromiter(((r.width, r.height) for r in rects), dtype=np.dtype((np.float64, 2)), count=n)
+        sizes /= 72.0
+        self.property_cache['pages_dims_array'] = sizes
+        self.property_cache['pages_dims'] = list(zip(*sizes.T.tolist())) if n else []
+
     @staticmethod
     def _is_large_format_page(w, h, long_edge_thresh=24, area_thresh=800):
         """
         Check if a page size exceeds defined large-format thresholds.
 
+        Works element-wise when given arrays of widths and heights.
+
         Parameters
         ----------
-        w : float
+        w : float or np.ndarray
             Width of the page in inches.
-        h : float
+        h : float or np.ndarray
             Height of the page in inches.
         long_edge_thresh : int, optional
             Minimum longer-edge length to consider large format (default=24).
@@ -117,12 +215,12 @@ class PDFFile:
 
         Returns
         -------
-        bool
+        bool or np.ndarray of bool
             True if page is large format, False otherwise.
         """
-        long_edge = max(w, h)
+        long_edge = np.maximum(w, h)
         area = w * h
-        return long_edge >= long_edge_thresh or area >= area_thresh
+        return (long_edge >= long_edge_thresh) | (area >= area_thresh)
     
     @staticmethod
     def pt_to_in(pt: float) -> float:
@@ -145,20 +243,14 @@ class PDFFile:
     def pages_dims(self) -> list:
         """
         Returns the dimensions of each page in inches.
+
+        Gathered when the document is opened in `__init__`.
         
         Returns
         -------
         list of tuples
             A list of tuples where each tuple contains the width and height of a page in inches.
         """
-        if 'pages_dims' in self.property_cache:
-            return self.property_cache['pages_dims']
-        logger.debug(f"Computing pages dimensions for {self.path}")
-        
-        with fitz.open(self.path) as doc:
-            dims = [(self.pt_to_in(page.rect.width), self.pt_to_in(page.rect.height)) for page in doc]
-            self.property_cache['pages_dims'] = dims
-        
         return self.property_cache['pages_dims']
 
     @property
@@ -176,16 +268,14 @@ class PDFFile:
             return self.property_cache['has_large_format']
         
         logger.debug(f"Checking for large format pages in {self.path}")
-        for w, h in self.pages_dims:
-            if self._is_large_format_page(w, h):
-                logger.debug(f"Page with size {w}x{h} inches is large format")
-                self.property_cache['has_large_format'] = True
-                break
-
-        if not 'has_large_format' in self.property_cache:
-            self.property_cache['has_large_format'] = False
-
-        return self.property_cache.get('has_large_format', False)
+        dims = self.property_cache['pages_dims_array']
+        large = self._is_large_format_page(dims[:, 0], dims[:, 1])
+        if large.any():
+            w, h = dims[np.argmax(large)]
+            logger.debug(f"Page with size {w}x{h} inches is large format")
+
+        self.property_cache['has_large_format'] = bool(large.any())
+        return self.property_cache['has_large_format']
     
 
 class PDFTextExtractor(FileTextExtractor):
@@ -202,16 +292,32 @@ class PDFTextExtractor(FileTextExtractor):
         Supported file extensions for this extractor.
     ocr_params : dict
         Parameters for OCR processing using ocrmypdf.
-    max_stream_size : int
-        Maximum file size (bytes) to process in memory before using a temp file.
+    use_cache : bool
+        Reuse OCR text from the shared text cache for files already OCRed.
+    parallel_pages : bool
+        Split the text layer of long documents across worker processes.
     """
     file_extensions = ['pdf']
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = False, parallel_pages: bool = False):
         """
-        Initialize PDFTextExtractor with default OCR parameters and stream-size threshold.
+        Initialize PDFTextExtractor with default OCR parameters.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            Cache OCR results by file content, by default False. Meant for
+            batch/CLI runs; in a request handler it would keep the text of
+            user uploads on disk.
+        parallel_pages : bool, optional
+            Extract the text layer of documents with PARALLEL_PAGES_MIN or more
+            pages in a process pool, by default False. For CLI/batch callers
+            that own the machine; a request handler already runs one
+            extraction per core and must not start pools of its own.
         """
         super().__init__()
+        self.use_cache = use_cache
+        self.parallel_pages = parallel_pages
         self.ocr_params = {
             'max_image_mpixels': 250,
             'rotate_pages': True,
@@ -224,12 +330,9 @@ class PDFTextExtractor(FileTextExtractor):
             'output_type': 'pdf',
             'tesseract_timeout': 300,  # default timeout for Tesseract OCR
         }
-
-        # threshold of files which cannot be processed in memory, default is 100 MB
-        self.max_stream_size = 100 * 1024 * 1024
     
     @staticmethod
-    def extract_text_with_ocr(pdf_path: Union[str, Path], ocr_params: dict) -> str:
+    def extract_text_with_ocr(pdf_path: Union[str, Path], ocr_params: dict, use_cache: bool = False) -> str:
         """
         Perform OCR on a PDF file and return the extracted text.
         
@@ -243,6 +346,9 @@ class PDFTextExtractor(FileTextExtractor):
             Path to the PDF file to be processed with OCR.
         ocr_params : dict
             Parameters for the OCR processing.
+        use_cache : bool, optional
+            Look the result up in (and store it to) the shared text cache, keyed
+            by the file's content and `ocr_params`, by default False.
 
         Returns
         -------
@@ -258,6 +364,14 @@ class PDFTextExtractor(FileTextExtractor):
         logger.debug(f"Starting OCR extraction for {input_pdf_path} with params: {ocr_params}")
         if not input_pdf_path.exists():
             raise FileNotFoundError(f"Input PDF file not found for OCR operation: {input_pdf_path}")
+
+        if use_cache:
+            key = _ocr_cache_key(input_pdf_path, ocr_params)
+            cache = get_text_cache()
+            text = cache.get(key)
+            if text is not None:
+                logger.debug(f"OCR cache hit for {input_pdf_path}")
+                return text
         
         with tempfile.TemporaryDirectory(prefix="ocr_") as td:
             # staging location is directory containing the input_pdf_path file
@@ -271,8 +385,33 @@ class PDFTextExtractor(FileTextExtractor):
             logger.debug(f"OCR completed, reading text from generated PDF")
 
             with fitz.open(output_pdf_path) as doc:
-                return "".join(page.get_text() for page in doc)
+                text = "".join(page.get_text(flags=TEXT_FLAGS) for page in doc)
+
+        if use_cache:
+            cache.set(key, text)
+        return text
     
+    def _text_layer(self, fitz_doc: fitz.Document, pdf_document: PDFFile) -> str:
+        """
+        Concatenated text layer of every page.
+
+        With parallel_pages on, PyMuPDF keeping the GIL during get_text (and a
+        Document not being shareable across threads) means long documents are
+        split into contiguous page ranges, each extracted by a worker process
+        that opens its own copy of the file. Results are joined in page order.
+        """
+        page_count = fitz_doc.page_count
+        workers = min(PARALLEL_PAGES_MAX_WORKERS, os.cpu_count() or 1)
+        if not self.parallel_pages or page_count < PARALLEL_PAGES_MIN or workers < 2:
+            return "".join(page.get_text(flags=TEXT_FLAGS) for page in fitz_doc)
+
+        step = -(-page_count // workers)  # ceil
+        starts = range(0, page_count, step)
+        stops = [min(start + step, page_count) for start in starts]
+        logger.debug(f"Extracting {page_count} pages of {pdf_document.path} with {len(starts)} processes")
+        with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+            return "".join(executor.map(_page_range_text, [pdf_document.path] * len(starts), starts, stops))
+
     def _fitz_doc_text(self, fitz_doc: fitz.Document, pdf_document: PDFFile) -> str:
         """
         Extract text from a fitz.Document, with fallback to OCR if any page is blank.
@@ -291,27 +430,129 @@ class PDFTextExtractor(FileTextExtractor):
         """
         logger.debug(f"Extracting text with fitz for document: {pdf_document.path}")
         ocr_needed_length_threshold = 100 # if found text is less than this, trigger OCR
-        pdf_text = ""
-        for _, page in enumerate(fitz_doc):
-            page_text = page.get_text()
-            pdf_text += page_text
+
+        # scanned documents have no text layer anywhere: look at the first, middle
+        # and last page before paying for a pass over every page
+        page_count = fitz_doc.page_count
+        sampled = sorted({0, page_count // 2, page_count - 1}) if page_count else []
+        sample = "".join(fitz_doc[i].get_text(flags=TEXT_FLAGS) for i in sampled)
+        if page_count > len(sampled) and len(sample) < ocr_needed_length_threshold // 3:
+            logger.debug(f"Sampled pages {sampled} have {len(sample)} characters of text, skipping full scan")
+            pdf_text = None
+        else:
+            pdf_text = self._text_layer(fitz_doc, pdf_document)
         
-        if len(pdf_text) >= ocr_needed_length_threshold:
+        if pdf_text is not None and len(pdf_text) >= ocr_needed_length_threshold:
             logger.debug(f"Extracted text length {len(pdf_text)}.")
             return pdf_text
+
+        # with nothing raster-like on any page, OCR has nothing to read: the
+        # document is digital and just short (e.g. a one-page form)
+        if not any(self._has_ocr_content(page) for page in fitz_doc):
+            logger.debug(f"No images or outlined text in {pdf_document.path}, keeping its text layer instead of OCR")
+            return self._text_layer(fitz_doc, pdf_document) if pdf_text is None else pdf_text
         
         logger.info(f"OCR needed for document: {pdf_document.path}")
-        ocr_params = self.ocr_params.copy()
+        ocr_params = self._resolved_ocr_params(pdf_document)
+        pdf_text = self.extract_text_with_ocr(pdf_path=pdf_document.path, ocr_params=ocr_params,
+                                              use_cache=self.use_cache)
+        return pdf_text
+
+    @staticmethod
+    def _has_ocr_content(page: fitz.Page) -> bool:
+        """
+        Whether OCR could find text on a page that its text layer lacks.
+
+        True for pages with images, and for pages with vector drawings but no
+        text layer: text drawn as outlines (e.g. SHX fonts in CAD plot sets)
+        only becomes readable once the page is rasterized.
+        """
+        if page.get_images():
+            return True
+        return not page.get_text(flags=TEXT_FLAGS).strip() and bool(page.get_cdrawings())
+
+    def _resolved_ocr_params(self, pdf_document: PDFFile) -> dict:
+        """
+        OCR parameters for one document, filling per-document defaults.
+
+        `ocr_params` is returned as is when it already sets the timeout and the
+        pixel limit (the default configuration); it is only copied when a value
+        has to be derived from the document. Callers must not mutate the result.
+        """
+        params = self.ocr_params
+        if params.get('tesseract_timeout') and params.get('max_image_mpixels'):
+            return params
+
+        params = params.copy()
         # if no timeout param in ocr_params, set a default based on page count
-        if not ocr_params.get('tesseract_timeout', None):
-            ocr_params['tesseract_timeout'] = min(300, pdf_document.page_count * 45)
+        if not params.get('tesseract_timeout', None):
+            params['tesseract_timeout'] = min(300, pdf_document.page_count * 45)
 
         # set the max_image_mpixels if not in ocr_params
-        if not ocr_params.get('max_image_mpixels', None):
-            ocr_params['max_image_mpixels'] = 1000 if pdf_document.has_large_format else 300
+        if not params.get('max_image_mpixels', None):
+            params['max_image_mpixels'] = 1000 if pdf_document.has_large_format else 300
+        return params
 
-        pdf_text = self.extract_text_with_ocr(pdf_path=pdf_document.path, ocr_params=ocr_params)
-        return pdf_text
+    def _extract_from_doc(self, path: Path, doc: fitz.Document) -> str:
+        """
+        Extract text from an already opened PDF.
+
+        Parameters
+        ----------
+        path : Path
+            Filesystem path of the PDF (used for metadata and OCR).
+        doc : fitz.Document
+            The opened document, shared with PDFFile so the file is parsed once.
+
+        Returns
+        -------
+        str
+            Extracted text.
+
+        Raises
+        ------
+        ValueError
+            If the PDF is encrypted.
+        """
+        pdf = PDFFile(path, doc=doc)
+        # Log PDF metadata
+        logger.debug(f"__call__: PDF metadata size={pdf.size}, pages={pdf.page_count}, encrypted={pdf.is_encrypted}")
+
+        # PyMuPDF can open encrypted PDFs only with a password; streaming doesn't help.
+        if pdf.is_encrypted:
+            logger.warning(f"PDF is encrypted, cannot extract text: {pdf.name}")
+            raise ValueError(f"PDF file is encrypted and cannot be processed: {pdf.name}")
+
+        return self._fitz_doc_text(fitz_doc=doc, pdf_document=pdf)
+
+    def extract_many(self, paths: List[str], workers: int | None = None) -> List[str]:
+        """
+        Extract many PDFs across a process pool.
+
+        Text-layer extraction holds the GIL and OCR is CPU-bound, so each file
+        runs in its own process. Workers get a copy of this extractor with
+        OCR limited to one single-threaded Tesseract job and no page-range
+        pools of their own, so the pool's process count is the only
+        parallelism.
+
+        Parameters
+        ----------
+        paths : list of str
+            PDF files to extract.
+        workers : int, optional
+            Number of processes, by default os.cpu_count().
+
+        Returns
+        -------
+        list of str
+            Extracted text per path, in input order; files that fail are
+            logged and returned as "".
+        """
+        workers = workers or os.cpu_count() or 1
+        # one file per task: OCR makes per-file cost too uneven for bigger chunks
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_worker_extract, paths))
 
     def __call__(self, pdf_filepath: str) -> str:
         """
@@ -336,34 +577,14 @@ class PDFTextExtractor(FileTextExtractor):
             validated = validate_file(pdf_filepath)
             # Log validated path
             logger.debug(f"__call__: validated file path {validated}")
-            pdf = PDFFile(validated)
-            # Log PDF metadata
-            logger.debug(f"__call__: PDF metadata size={pdf.size}, pages={pdf.page_count}, encrypted={pdf.is_encrypted}")
-
-            # PyMuPDF can open encrypted PDFs only with a password; streaming doesn't help.
-            if pdf.is_encrypted:
-                logger.warning(f"PDF is encrypted, cannot extract text: {pdf.name}")
-                raise ValueError(f"PDF file is encrypted and cannot be processed: {pdf.name}")
-            
-            # if the file is small enough, read it into memory
-            if pdf.size <= self.max_stream_size:
-                logger.debug(f"PDF size {pdf.size} <= max_stream_size ({self.max_stream_size}), processing in-memory")
-                data = pdf.path.read_bytes()
-                doc = fitz.open(stream=data, filetype="pdf")
-                extracted_text = self._fitz_doc_text(fitz_doc=doc, pdf_document=pdf)
-                doc.close()
-
-            else:
-                logger.debug(f"PDF size {pdf.size} > max_stream_size ({self.max_stream_size}), processing via temp file")
-                with tempfile.TemporaryDirectory(prefix="text_extractor_") as temp_dir:
-                    work_path = Path(temp_dir) / pdf.name
-                    shutil.copy(pdf.path, work_path)
-                    doc = fitz.open(work_path)
-                    extracted_text = self._fitz_doc_text(fitz_doc=doc, pdf_document=pdf)
-                    doc.close()
+
+            # MuPDF opens the file read-only and reads it lazily, whatever its size
+            doc = fitz.open(validated)
+            extracted_text = self._extract_from_doc(validated, doc)
+            doc.close()
         
         except Exception as e:
-            logger.error(f"Error extracting text from PDF {pdf.name}: {e}")
+            logger.error(f"Error extracting text from PDF {Path(pdf_filepath).stem}: {e}")
             raise e
 
         finally:
@@ -1,6 +1,7 @@
 # text_extraction/web_extractor.py
 
 import email
+import io
 import logging
 from pathlib import Path
 from typing import List
@@ -16,15 +17,16 @@ class HtmlTextExtractor(FileTextExtractor):
     Extract text content from HTML and MHTML files.
 
     This class implements text extraction from HTML-based file formats, including
-    `.html`, `.htm`, `.mhtml`, and `.mht`. It uses BeautifulSoup for parsing and
-    cleaning the HTML content, removing unnecessary tags like `<script>`, `<style>`,
+    `.html`, `.htm`, `.mhtml`, and `.mht`. It uses selectolax (or BeautifulSoup,
+    if another parser is named) for parsing and cleaning the HTML content,
+    removing unnecessary tags like `<script>`, `<style>`,
 
     Attributes
     ----------
     file_extensions : List[str]
         Supported file extensions for HTML-based files.
     parser : str
-        The parser to use with BeautifulSoup, e.g., "lxml" or "html.parser".
+        "selectolax", or a BeautifulSoup parser such as "lxml" or "html.parser".
 
     Methods
     -------
@@ -35,14 +37,14 @@ class HtmlTextExtractor(FileTextExtractor):
     """
     file_extensions: List[str] = ["html", "htm", "mhtml", "mht"]
 
-    def __init__(self, parser: str = "lxml"):
+    def __init__(self, parser: str = "selectolax"):
         """
         Initialize the HtmlTextExtractor.
 
         Parameters
         ----------
         parser : str, optional
-            The parser to use with BeautifulSoup, by default "lxml".
+            The HTML parser passed to `strip_html`, by default "selectolax".
         """
         super().__init__()
         self.parser = parser
@@ -114,6 +116,8 @@ class EmailTextExtractor(FileTextExtractor):
 
     This class implements text extraction from email files, handling both plain text
     and HTML content. It uses the `email` module to parse the email structure.
+    Plain-text parts are preferred; HTML parts are only used when a message
+    has no plain text.
 
     Attributes
     ----------
@@ -127,14 +131,14 @@ class EmailTextExtractor(FileTextExtractor):
     """
     file_extensions: List[str] = ["eml", "msg"]
 
-    def __init__(self, parser: str = "lxml"):
+    def __init__(self, parser: str = "selectolax"):
         """
         Initialize the EmailTextExtractor.
 
         Parameters
         ----------
         parser : str, optional
-            The parser to use with BeautifulSoup for HTML content, by default "lxml".
+            The HTML parser passed to `strip_html` for HTML parts, by default "selectolax".
         """
         super().__init__()
         self.parser = parser
@@ -168,16 +172,27 @@ class EmailTextExtractor(FileTextExtractor):
         with open(p, "rb") as f:
             msg = email.message_from_binary_file(f, policy=policy.default)
 
-        text_parts = []
+        plain_parts = []
+        html_parts = []
         for part in msg.walk():
             content_type = part.get_content_type()
             if content_type == "text/plain":
-                text_parts.append(part.get_content())
+                plain_parts.append(part.get_content())
             elif content_type == "text/html":
-                html = part.get_content()
-                # use shared HTML stripping
-                text_parts.append(strip_html(html, parser=self.parser))
+                html_parts.append(part.get_content())
+
+        # multipart/alternative mail carries the same body as plain text and HTML;
+        # only parse the HTML when there is no plain text version
+        if any(t.strip() for t in plain_parts):
+            text_parts = plain_parts
+        else:
+            # use shared HTML stripping
+            text_parts = (strip_html(html, parser=self.parser) for html in html_parts)
+
+        buf = io.StringIO()
+        for text in text_parts:
+            buf.write(text)
+            buf.write(" ")
 
         # normalize overall whitespace
-        combined = " ".join(text_parts)
-        return normalize_whitespace(combined)
+        return normalize_whitespace(buf.getvalue())
@@ -1,9 +1,21 @@
+import functools
+import os
 from pathlib import Path, PurePosixPath
 
 
+def _normalize(path: str | Path, strict: bool = False) -> Path:
+    # strict follows symlinks (filesystem I/O); otherwise it's string work only
+    if strict:
+        return Path(path).expanduser().resolve()
+    return Path(os.path.abspath(os.path.expanduser(path)))
+
+def _is_absolute(path: str | Path) -> bool:
+    return os.path.isabs(os.path.expanduser(path))
+
 def extract_server_dirs(full_path: str | Path,
                        base_mount: str | Path,
-                       include_filename: bool = False) -> str:
+                       include_filename: bool = False,
+                       strict: bool = False) -> str:
     """
     Extract the server directory path (and optionally filename) relative to a mount point.
 
@@ -16,16 +28,44 @@ def extract_server_dirs(full_path: str | Path,
     include_filename : bool, default False
                 Whether to include the filename in the returned path.
                 If False, only returns the directory structure.
+    strict : bool, default False
+                Resolve symlinks in both paths before comparing them. By
+                default the paths are only normalized as strings (".."
+                collapsed, "~" expanded), which touches no files.
 
     Returns
     -------
     str   --  value suitable for file_locations.file_server_directories
               (always forward-slash separators, no leading slash)
               If include_filename=False, excludes the filename component.
+
+    Results are memoized when strict is False and both paths are absolute:
+    the answer then depends on the strings alone. strict=True (filesystem
+    state) and relative paths (the cwd) are computed on every call.
     """
+    if strict or not (_is_absolute(full_path) and _is_absolute(base_mount)):
+        return _server_dirs(full_path, base_mount, include_filename, strict)
+    return _server_dirs_cached(str(full_path), str(base_mount), include_filename)
+
+def _server_dirs(full_path: str | Path,
+                 base_mount: str | Path,
+                 include_filename: bool,
+                 strict: bool) -> str:
     # Normalise to platform-aware Path objects
-    full = Path(full_path).expanduser().resolve()
-    base = Path(base_mount).expanduser().resolve()
+    full = _normalize(full_path, strict)
+    base = _normalize(base_mount, strict)
+
+    # 0) Fast path: both paths are normalized strings, so a file under the mount
+    #    is just a prefix match; anything else takes the Path route below
+    base_str = str(base)
+    if not base_str.endswith(os.sep):
+        base_str += os.sep
+    full_str = str(full)
+    if full_str.startswith(base_str):
+        parts = full_str[len(base_str):].split(os.sep)
+        if not include_filename:
+            parts = parts[:-1]
+        return "/".join(parts) or "."
 
     # 1) Get the sub-path *relative* to the mount
     try:
@@ -41,6 +81,10 @@ def extract_server_dirs(full_path: str | Path,
     # 3) Convert to POSIX form (forces forward slashes)
     return str(PurePosixPath(rel_parts))
 
+@functools.lru_cache(maxsize=8192)
+def _server_dirs_cached(full_path: str, base_mount: str, include_filename: bool) -> str:
+    return _server_dirs(full_path, base_mount, include_filename, strict=False)
+
 def build_file_path(base_mount: str,
                     server_dir: str,
                     filename: str = None) -> Path: